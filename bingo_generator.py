@@ -0,0 +1,514 @@
+"""Library API for generating bingo cards from Python.
+
+BingoGenerator keeps everything that is shared between cards (tile pool, processed
+images, theme, template, fonts and tile layouts) warm in memory and renders one card per
+seed, without any console output or files. The create-bingo-card CLI is built on the
+same helpers.
+
+Example:
+    >>> assets = CardAssets.from_files(
+    ...     background=Path("images/default_background.png"),
+    ...     h_bingo=Path("images/hexy_bald.png"),
+    ...     bingo=Path("images/rat_king.png"),
+    ...     double_bingo=Path("images/rat_king.png"),
+    ...     super_bingo=Path("images/god_gamer.png"),
+    ... )
+    >>> generator = BingoGenerator(load_bingo_data(Path("Bingo Tiles.csv")), "ghost", assets)
+    >>> html = generator.render(seed=42)
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Template
+from loguru import logger
+
+from font_inliner import build_inline_font_css
+from image_processor import (
+    IMAGE_CONFIGS,
+    get_base64_mime_type,
+    process_image,
+    slice_background_tiles,
+)
+from template_minifier import load_minified_template
+from themes import Theme, compile_theme_assets, get_theme, list_themes
+from tile_layout import find_tile_font, layout_tiles
+
+# Embedding programs get exceptions, not log lines on their stderr; the CLIs turn the
+# error messages of this module and its helpers back on with logger.enable
+logger.disable(__name__)
+
+DEFAULT_TEMPLATE_PATH = Path("bingo.jinja")
+
+# Template shipped next to this module, used by BingoGenerator regardless of the working directory
+BUNDLED_TEMPLATE_PATH = Path(__file__).resolve().with_name("bingo.jinja")
+
+# Streamed output is buffered into chunks of about this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def load_bingo_data(csv_file_path: Path) -> list[str]:
+    """Load bingo tile values from a CSV file.
+
+    Args:
+        csv_file_path: Path to the CSV file containing bingo tile values.
+
+    Returns:
+        Sorted list of unique strings representing bingo tile values.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+    """
+    if not csv_file_path.exists():
+        logger.error(f"CSV file not found: {csv_file_path}")
+        raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
+
+    with csv_file_path.open(encoding="utf-8") as f:
+        # Read lines, strip whitespace, and filter out empty lines
+        lines = [line.strip() for line in f.readlines()]
+        # Sorted, so the pool (and seeded grids drawn from it) is the same in every process
+        unique_items = sorted({line for line in lines if line})
+        return unique_items
+
+
+def escape_quotes(items: list[str]) -> list[str]:
+    """Add escape character to quotes in strings so they are added properly to the HTML.
+
+    Args:
+        items: List of strings that may contain quotes.
+
+    Returns:
+        List of strings with escaped quotes.
+    """
+    return [item.replace('"', '\\"') for item in items]
+
+
+def load_jinja_template(template_path: Path | None = None) -> Template:
+    """Load the bingo Jinja template file.
+
+    Args:
+        template_path: Path to the Jinja template file. If None, defaults to 'bingo.jinja'
+            in the current directory.
+
+    Returns:
+        Jinja Template object loaded from the template file.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    if template_path is None:
+        template_path = DEFAULT_TEMPLATE_PATH.resolve()
+
+    if not template_path.exists():
+        logger.error(f"Template file not found: {template_path}")
+        raise FileNotFoundError(f"Template file not found: {template_path}")
+
+    # Load the jinja template
+    with open(template_path, encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def load_card_template(
+        theme_config: Theme | None = None,
+        minify: bool = False,
+        template_path: Path | None = None,
+) -> Template:
+    """Load the bingo template, minified for production if requested.
+
+    Args:
+        theme_config: Optional theme configuration dictionary (the minified template is
+            specific to its theme).
+        minify: If True, load the cached minified template for the theme.
+        template_path: Path to the Jinja template file. If None, defaults to 'bingo.jinja'
+            in the current directory.
+
+    Returns:
+        Jinja Template object.
+    """
+    if minify:
+        return load_minified_template(template_path or DEFAULT_TEMPLATE_PATH.resolve(), theme_config)
+    return load_jinja_template(template_path)
+
+
+def get_random_bingo_items(
+        items: list[str],
+        free_center: bool = False,
+        tile_size: int = 5,
+        rng: random.Random | None = None,
+) -> list[list[str]]:
+    """Generate a randomized 2D grid of bingo items.
+
+    Args:
+        items: List of possible bingo tile values to choose from.
+        free_center: If True, sets the center tile to 'FREE' (only works with odd tile sizes).
+        tile_size: Number of rows and columns in the bingo grid (default: 5).
+        rng: Optional random number generator, e.g. a seeded one for reproducible grids.
+            Defaults to the random module's shared generator.
+
+    Returns:
+        2D list (list of lists) containing the randomized bingo grid.
+
+    Raises:
+        ValueError: If there aren't enough unique items for the requested tile size,
+            or if trying to set a free center with an even-sized grid.
+    """
+    # Check that there are enough items to support the bingo tile size
+    if len(items) < tile_size ** 2:
+        raise ValueError(
+            f"Not enough unique items in the CSV file "
+            f"for the bingo size {tile_size}x{tile_size}. "
+            f"Need at least {tile_size ** 2}, but only have {len(items)}."
+        )
+
+    # Get randomized list of items. Convert to set to ensure they are unique
+    randomized_items = (rng or random).sample(items, tile_size ** 2)
+
+    # Create the bingo data to fill the jinja html table
+    bingo_data = []
+    item_number = 0
+    for _ in range(tile_size):
+        row_data = []
+        for _ in range(tile_size):
+            row_data.append(randomized_items[item_number])
+            item_number += 1
+        bingo_data.append(row_data)
+
+    # Set the center square as FREE
+    if free_center:
+        if tile_size % 2 == 0:
+            raise ValueError("Cannot set center tile with even-sized bingo grid.")
+        center_index = tile_size // 2
+        bingo_data[center_index][center_index] = "FREE"
+
+    return bingo_data
+
+
+def get_card_id(initial_items: list[list[str]], all_bingo_items: list[str]) -> str:
+    """Derive a stable card identifier from the grid and tile pool.
+
+    Args:
+        initial_items: 2D list containing the initial bingo grid layout.
+        all_bingo_items: List of all possible bingo items.
+
+    Returns:
+        16 character hex identifier.
+    """
+    encoded = json.dumps([initial_items, sorted(all_bingo_items)], ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def get_card_template_data(
+        initial_items: list[list[str]],
+        all_bingo_items: list[str],
+        image_encoding: str,
+        h_bingo_image_encoding: str,
+        bingo_image_encoding: str,
+        double_bingo_image_encoding: str,
+        super_bingo_image_encoding: str,
+        background_color: str | None = None,
+        theme_config: Theme | None = None,
+        inline_font_css: str | None = None,
+        tile_font: Path | None = None,
+        card_id: str | None = None,
+        background_tiles: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build the data the bingo template renders a card from.
+
+    Args:
+        initial_items: 2D list containing the initial bingo grid layout.
+        all_bingo_items: List of all possible bingo items for randomization.
+        image_encoding: Base64-encoded background image string.
+        h_bingo_image_encoding: Base64-encoded horizontal bingo celebration image string.
+        bingo_image_encoding: Base64-encoded standard bingo celebration image string.
+        double_bingo_image_encoding: Base64-encoded double bingo celebration image string.
+        super_bingo_image_encoding: Base64-encoded super bingo celebration image string.
+        background_color: Hex color code for the background. Defaults to the theme's
+            background color, or '#f5f9ff' without a theme.
+        theme_config: Optional theme configuration dictionary.
+        inline_font_css: Optional @font-face rules embedding the theme fonts (see
+            font_inliner.py). If None, the fonts are loaded from Google Fonts.
+        tile_font: Optional font file used to measure the tile text layout. If None,
+            Pillow's default font is used as an approximation.
+        card_id: Optional identifier shown on the card, which also saves its board state
+            under it in the browser. Defaults to a hash of the grid and tile pool.
+        background_tiles: Optional base64-encoded pieces of the background image, one
+            per tile in row-major order (see slice_background_tiles). If given, each tile
+            reveals its own piece instead of the whole image being drawn behind the grid.
+
+    Returns:
+        Template data dictionary.
+    """
+    # Precompute line breaks and font scale classes for every tile value
+    tile_layouts = layout_tiles(all_bingo_items, tile_font)
+    layouts_by_item = dict(zip(all_bingo_items, tile_layouts, strict=True))
+    initial_layouts = [
+        [layouts_by_item.get(cell) or layout_tiles([cell], tile_font)[0] for cell in row]
+        for row in initial_items
+    ]
+
+    # Pool index of each cell, so the card starts from this grid (-1 for FREE)
+    pool_indices = {item: index for index, item in enumerate(all_bingo_items)}
+    initial_values = [pool_indices.get(cell, -1) for row in initial_items for cell in row]
+
+    if card_id is None:
+        card_id = get_card_id(initial_items, all_bingo_items)
+
+    if background_color is None:
+        background_color = theme_config["colors"]["background"] if theme_config else "#f5f9ff"
+
+    # Build template data dictionary
+    template_data = {
+        "card_id": card_id,
+        "initial_items": initial_items,
+        "initial_layouts": initial_layouts,
+        "initial_values": initial_values,
+        "tile_layouts": tile_layouts,
+        "all_bingo_items": escape_quotes(all_bingo_items),
+        "image": image_encoding,
+        "h_bingo_image": h_bingo_image_encoding,
+        "bingo_image": bingo_image_encoding,
+        "double_bingo_image": double_bingo_image_encoding,
+        "super_bingo_image": super_bingo_image_encoding,
+        "N_options": len(all_bingo_items),
+        "background_color": background_color,
+        "inline_font_css": inline_font_css,
+        "background_tiles": background_tiles,
+        # Theme CSS variables, font links and text, compiled once per theme
+        "theme_assets": compile_theme_assets(theme_config),
+    }
+
+    # Data URI MIME types, as animated celebration images are encoded as WebP
+    for key in ("image", "h_bingo_image", "bingo_image", "double_bingo_image", "super_bingo_image"):
+        template_data[f"{key}_mime"] = get_base64_mime_type(template_data[key])
+
+    # Add theme config if provided
+    if theme_config:
+        template_data["theme"] = theme_config
+
+    return template_data
+
+
+@dataclass(frozen=True)
+class CardAssets:
+    """Processed images embedded in every card, as base64-encoded strings."""
+    background: str
+    h_bingo: str
+    bingo: str
+    double_bingo: str
+    super_bingo: str
+
+    @classmethod
+    def from_files(
+            cls,
+            background: Path,
+            h_bingo: Path,
+            bingo: Path,
+            double_bingo: Path,
+            super_bingo: Path,
+            no_downscaling: bool = False,
+    ) -> "CardAssets":
+        """Process the card images from their source files.
+
+        Args:
+            background: Path to the background image revealed on the board.
+            h_bingo: Path to the image used for the H-bingo celebration.
+            bingo: Path to the image used for the standard bingo celebration.
+            double_bingo: Path to the image used for the double bingo celebration.
+            super_bingo: Path to the image used for the super bingo celebration.
+            no_downscaling: If True, disable automatic image scaling.
+
+        Returns:
+            Processed card assets.
+
+        Raises:
+            FileNotFoundError: If an image file does not exist.
+            ValueError: If an image has too many pixels.
+        """
+        paths = {
+            "background": background,
+            "h_bingo": h_bingo,
+            "bingo": bingo,
+            "double_bingo": double_bingo,
+            "super_bingo": super_bingo,
+        }
+        return cls(**{
+            key: process_image(Path(paths[key]), image_type=img_type, no_downscaling=no_downscaling)
+            for key, _, img_type in IMAGE_CONFIGS
+        })
+
+
+class BingoGenerator:
+    """Render bingo cards from warm, shared state.
+
+    The tile pool, theme, template, fonts and background slices are prepared once when
+    the generator is created, so each render only lays out a new grid. A generator has no
+    console output and writes no files, so it can be shared by the requests of a
+    long-running worker (errors are raised, and logged through loguru).
+    """
+
+    def __init__(
+            self,
+            pool: Iterable[str],
+            theme: str | Theme | None,
+            assets: CardAssets,
+            tile_size: int = 5,
+            free_center: bool = False,
+            background_color: str | None = None,
+            minify: bool = False,
+            fonts_dir: Path | None = None,
+            background_tiles: bool = False,
+            template_path: Path | None = None,
+    ) -> None:
+        """Prepare the shared state for rendering cards.
+
+        Args:
+            pool: Bingo tile values; duplicates and empty values are dropped.
+            theme: Theme name (see themes.list_themes), theme configuration dictionary,
+                or None for the default look.
+            assets: Processed card images.
+            tile_size: Number of rows and columns in the bingo grid.
+            free_center: If True, sets the center tile to 'FREE' (odd tile sizes only).
+            background_color: Optional hex color for the background. Defaults to the
+                theme's background color.
+            minify: If True, render with the minified template for the theme.
+            fonts_dir: Optional directory with the theme's font files to embed, subset
+                to the glyphs used, instead of loading Google Fonts.
+            background_tiles: If True, slice the background image into one piece per tile.
+            template_path: Path to the Jinja template file. Defaults to the bingo.jinja
+                next to this module.
+
+        Raises:
+            ValueError: If the theme is unknown, the pool is too small for the grid, or the
+                center tile cannot be free.
+        """
+        if isinstance(theme, str):
+            if theme not in list_themes():
+                raise ValueError(f"Unknown theme: {theme}. Use one of: {', '.join(list_themes())}")
+            theme = get_theme(theme)
+        # Sorted, so a seed gives the same grid however the pool was collected
+        pool = sorted({item.strip() for item in pool if item.strip()})
+        if len(pool) < tile_size ** 2:
+            raise ValueError(
+                f"Not enough unique items for the bingo size {tile_size}x{tile_size}. "
+                f"Need at least {tile_size ** 2}, but only have {len(pool)}."
+            )
+        if free_center and tile_size % 2 == 0:
+            raise ValueError("Cannot set center tile with even-sized bingo grid.")
+
+        self.pool = pool
+        self.theme_config = theme
+        self.assets = assets
+        self.tile_size = tile_size
+        self.free_center = free_center
+        self.background_color = background_color
+
+        template_path = template_path or BUNDLED_TEMPLATE_PATH
+        self.template = load_card_template(theme, minify=minify, template_path=template_path)
+        self.inline_font_css = build_inline_font_css(fonts_dir, pool, theme) if fonts_dir else None
+        self.tile_font = find_tile_font(fonts_dir, theme)
+        self.background_tiles = (
+            slice_background_tiles(assets.background, tile_size) if background_tiles else None
+        )
+        # Lay out the whole pool now rather than on the first render
+        layout_tiles(pool, self.tile_font)
+
+    def grid(self, seed: int | str | bytes | None = None) -> list[list[str]]:
+        """Get the grid of the card for a seed.
+
+        Args:
+            seed: Seed of the card; the same seed always gives the same grid. If None, a
+                random grid is drawn.
+
+        Returns:
+            2D list containing the bingo grid.
+        """
+        return get_random_bingo_items(
+            self.pool, free_center=self.free_center, tile_size=self.tile_size, rng=random.Random(seed)
+        )
+
+    def template_data(self, seed: int | str | bytes | None = None) -> dict[str, Any]:
+        """Get the template data of the card for a seed (see get_card_template_data).
+
+        Args:
+            seed: Seed of the card.
+
+        Returns:
+            Template data dictionary.
+        """
+        return get_card_template_data(
+            initial_items=self.grid(seed),
+            all_bingo_items=self.pool,
+            image_encoding=self.assets.background,
+            h_bingo_image_encoding=self.assets.h_bingo,
+            bingo_image_encoding=self.assets.bingo,
+            double_bingo_image_encoding=self.assets.double_bingo,
+            super_bingo_image_encoding=self.assets.super_bingo,
+            background_color=self.background_color,
+            theme_config=self.theme_config,
+            inline_font_css=self.inline_font_css,
+            tile_font=self.tile_font,
+            background_tiles=self.background_tiles,
+        )
+
+    def render(self, seed: int | str | bytes | None = None) -> bytes:
+        """Render the card for a seed.
+
+        The page opens on the seed's grid and keeps it until the player presses Randomize.
+
+        Args:
+            seed: Seed of the card; the same seed always gives the same card. If None, a
+                random card is rendered.
+
+        Returns:
+            UTF-8 encoded HTML document.
+        """
+        return self.template.render(self.template_data(seed)).encode("utf-8")
+
+    def stream(
+            self, seed: int | str | bytes | None = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Render the card for a seed as it is generated, e.g. for a streaming response.
+
+        Args:
+            seed: Seed of the card.
+            chunk_size: Approximate size of the yielded chunks in bytes.
+
+        Yields:
+            UTF-8 encoded chunks of the HTML document.
+        """
+        buffer: list[bytes] = []
+        buffered = 0
+        for text in self.template.generate(self.template_data(seed)):
+            data = text.encode("utf-8")
+            buffer.append(data)
+            buffered += len(data)
+            if buffered >= chunk_size:
+                yield b"".join(buffer)
+                buffer = []
+                buffered = 0
+        if buffer:
+            yield b"".join(buffer)
+
+    async def astream(
+            self, seed: int | str | bytes | None = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Render the card for a seed without blocking the event loop.
+
+        Each chunk is rendered in a worker thread (see stream).
+
+        Args:
+            seed: Seed of the card.
+            chunk_size: Approximate size of the yielded chunks in bytes.
+
+        Yields:
+            UTF-8 encoded chunks of the HTML document.
+        """
+        chunks = self.stream(seed, chunk_size)
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
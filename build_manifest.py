@@ -0,0 +1,176 @@
+"""Build manifest for incremental bingo card generation.
+
+The manifest lives next to the generated outputs and records a hash of every input that
+went into each output (CSV, images, template, theme and CLI options). On a rerun, outputs
+whose recorded hash still matches are skipped.
+
+Input hashes only depend on file contents and names, never on where the files are, so the
+same inputs give the same hash on any machine or checkout (shards compare them).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from font_inliner import find_font_files, get_theme_font_families
+from image_processor import ASSET_MANIFEST_NAME, IMAGE_CONFIGS
+from themes import Theme
+
+MANIFEST_NAME = ".bingo-manifest.json"
+MANIFEST_VERSION = 1
+
+OPTION_KEYS = (
+    "free_center",
+    "no_downscaling",
+    "background_color",
+    "count",
+    "gzip_output",
+    "minify",
+    "background_tiles",
+    "max_card_kb",
+    "fit_budget",
+    "master_seed",
+)
+
+
+class BuildManifest:
+    """Input hashes of previously generated outputs.
+
+    File hashes are cached by (mtime, size) so unchanged inputs are not re-read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.files: dict[str, dict[str, Any]] = {}
+        self.outputs: dict[str, str] = {}
+
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # A corrupt manifest only means everything is rebuilt
+                data = {}
+            if data.get("version") == MANIFEST_VERSION:
+                self.files = data.get("files", {})
+                self.outputs = data.get("outputs", {})
+
+    def file_hash(self, file_path: Path) -> str:
+        """Get the SHA-256 hash of a file, reusing the cached hash if the file is unchanged.
+
+        Args:
+            file_path: Path of the file to hash.
+
+        Returns:
+            Hex digest of the file contents.
+        """
+        file_path = file_path.expanduser().resolve()
+        stat = file_path.stat()
+        cached = self.files.get(str(file_path))
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["sha256"]
+
+        digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        self.files[str(file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+        }
+        return digest
+
+    def input_key(
+            self,
+            cfg: dict[str, Any],
+            tile_size: int,
+            template_path: Path,
+            theme_config: Theme | None = None,
+    ) -> str:
+        """Compute the hash of every input that goes into a batch of cards.
+
+        Args:
+            cfg: Dictionary containing configuration parameters for the bingo card.
+            tile_size: Number of rows and columns in the bingo grid.
+            template_path: Path to the Jinja template file.
+            theme_config: Optional theme configuration dictionary.
+
+        Returns:
+            Hex digest identifying the inputs.
+        """
+        payload = {
+            "csv": self.file_hash(Path(cfg["csv_file"])),
+            "images": {
+                config_key: self.file_hash(Path(cfg[config_key]))
+                for _, config_key, _ in IMAGE_CONFIGS
+            },
+            "template": self.file_hash(template_path),
+            "fonts": self._font_hashes(cfg, theme_config),
+            "prepared_assets": self._prepared_asset_hashes(cfg),
+            "theme": theme_config,
+            "options": {key: cfg.get(key) for key in OPTION_KEYS},
+            "tile_size": tile_size,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _font_hashes(self, cfg: dict[str, Any], theme_config: Theme | None) -> dict[str, str]:
+        if not cfg.get("fonts_dir"):
+            return {}
+        fonts_dir = Path(cfg["fonts_dir"]).expanduser().resolve()
+        return {
+            font_path.name: self.file_hash(font_path)
+            for family in get_theme_font_families(theme_config)
+            for font_path in find_font_files(fonts_dir, family)
+        }
+
+    def _prepared_asset_hashes(self, cfg: dict[str, Any]) -> dict[str, str] | None:
+        if not cfg.get("assets_manifest"):
+            return None
+        manifest_path = Path(cfg["assets_manifest"]).expanduser().resolve()
+        if manifest_path.is_dir():
+            manifest_path = manifest_path / ASSET_MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        # The manifest and the variant files it lists, by name
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        variant_files = sorted({
+            variant["file"]
+            for entry in manifest.get("images", {}).values()
+            for variant in entry["variants"].values()
+        })
+        return {
+            ASSET_MANIFEST_NAME: self.file_hash(manifest_path),
+            **{
+                name: self.file_hash(manifest_path.parent / name)
+                for name in variant_files
+                if (manifest_path.parent / name).exists()
+            },
+        }
+
+    def is_up_to_date(self, outputs: list[Path], key: str) -> bool:
+        """Check whether all outputs exist and were built from the given inputs.
+
+        Args:
+            outputs: Paths of the outputs to check.
+            key: Input hash the outputs should have been built from.
+
+        Returns:
+            True if no output needs to be rebuilt.
+        """
+        return all(
+            self.outputs.get(str(output)) == key and output.exists() for output in outputs
+        )
+
+    def record(self, outputs: list[Path], key: str) -> None:
+        """Record that outputs were built from the given inputs.
+
+        Args:
+            outputs: Paths of the generated outputs.
+            key: Input hash the outputs were built from.
+        """
+        for output in outputs:
+            self.outputs[str(output)] = key
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        data = {"version": MANIFEST_VERSION, "files": self.files, "outputs": self.outputs}
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
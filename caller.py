@@ -0,0 +1,316 @@
+"""Caller console for in-person games: find the winning cards as tiles are called.
+
+create-bingo-card --record-grids writes the grid of every issued card to a JSON Lines
+file. The caller loads it into an inverted index: for each tile and cell position, a
+bitmask (a Python int) of the cards that have the tile in that cell. Calling a tile ORs
+its masks into the called cells, and a line is complete on exactly the cards in the AND
+of its cells' masks, so each call costs a few bitwise operations per line rather than a
+loop over the cards, even for 100k-card events.
+"""
+
+import json
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+import click
+import questionary
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+FREE_TILE = "FREE"
+
+# (card ID, grid) for one issued card
+RecordedCard = tuple[str, list[list[str]]]
+
+
+class GridRecorder:
+    """Write the grid of every issued card to a JSON Lines file.
+
+    Recorders are context managers; the file is closed when the context exits.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._file = path.open(mode="w", encoding="utf-8")
+
+    def record(self, card_id: str, grid: list[list[str]]) -> None:
+        """Record an issued card.
+
+        Args:
+            card_id: Identifier of the card.
+            grid: 2D list containing the card's bingo grid.
+        """
+        self._file.write(json.dumps({"card_id": card_id, "grid": grid}, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "GridRecorder":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def load_recorded_cards(path: Path) -> list[RecordedCard]:
+    """Load the cards written by GridRecorder.
+
+    Args:
+        path: Path to the JSON Lines file.
+
+    Returns:
+        List of (card ID, grid) tuples.
+    """
+    with path.open(encoding="utf-8") as f:
+        return [(entry["card_id"], entry["grid"]) for entry in map(json.loads, f) if entry]
+
+
+def get_patterns(tile_size: int) -> list[tuple[str, list[int]]]:
+    """Get the winning patterns of a grid size, as in the card's JavaScript.
+
+    Args:
+        tile_size: Number of rows and columns in the bingo grid.
+
+    Returns:
+        List of (pattern name, cell indices) tuples: rows, columns, both diagonals and
+        the H pattern (left column, right column and middle row).
+    """
+    rows = [[row * tile_size + col for col in range(tile_size)] for row in range(tile_size)]
+    columns = [[row * tile_size + col for row in range(tile_size)] for col in range(tile_size)]
+    middle = tile_size // 2
+    return [
+        *((f"row {index + 1}", cells) for index, cells in enumerate(rows)),
+        *((f"column {index + 1}", cells) for index, cells in enumerate(columns)),
+        ("diagonal", [i * tile_size + i for i in range(tile_size)]),
+        ("anti-diagonal", [i * tile_size + (tile_size - 1 - i) for i in range(tile_size)]),
+        ("H", sorted({*columns[0], *columns[-1], *rows[middle]})),
+    ]
+
+
+@dataclass(frozen=True)
+class Win:
+    """A pattern completed on a card."""
+    card_id: str
+    pattern: str
+
+
+def _to_bitmask(indices: list[int]) -> int:
+    """Build the bitmask with the given (ascending) bit indices set."""
+    bits = bytearray(indices[-1] // 8 + 1)
+    for index in indices:
+        bits[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _bit_indices(bitmask: int) -> list[int]:
+    """Get the indices of the set bits of a bitmask, lowest first."""
+    # One pass over the binary digits; clearing the bits one by one would copy the
+    # bitmask for every set bit
+    bits = bin(bitmask)[:1:-1]
+    indices = []
+    index = bits.find("1")
+    while index != -1:
+        indices.append(index)
+        index = bits.find("1", index + 1)
+    return indices
+
+
+class _GridSizeIndex:
+    """Index of the cards of one grid size."""
+
+    def __init__(self, tile_size: int, cards: list[RecordedCard]) -> None:
+        self.tile_size = tile_size
+        self.card_ids = [card_id for card_id, _ in cards]
+
+        # Collect the card numbers first: growing the bitmasks card by card would copy
+        # them once per card
+        card_numbers: dict[str, dict[int, list[int]]] = {}
+        for card_number, (_, grid) in enumerate(cards):
+            for cell, tile in enumerate(tile for row in grid for tile in row):
+                card_numbers.setdefault(tile, {}).setdefault(cell, []).append(card_number)
+        # tile -> cell index -> bitmask of the cards with the tile in that cell
+        self.tile_cells = {
+            tile: {cell: _to_bitmask(numbers) for cell, numbers in cells.items()}
+            for tile, cells in card_numbers.items()
+        }
+        # cell index -> bitmask of the cards whose tile in that cell has been called
+        self.called_cells = [0] * (tile_size * tile_size)
+        self.patterns = get_patterns(tile_size)
+        # Bitmask of the cards that completed each pattern
+        self.completed = [0] * len(self.patterns)
+        # cell index -> indices of the patterns containing it
+        self.cell_patterns: list[list[int]] = [[] for _ in range(tile_size * tile_size)]
+        for pattern_index, (_, cells) in enumerate(self.patterns):
+            for cell in cells:
+                self.cell_patterns[cell].append(pattern_index)
+
+    def call(self, tile: str) -> list[Win]:
+        cells = self.tile_cells.get(tile)
+        if not cells:
+            return []
+        for cell, cards in cells.items():
+            self.called_cells[cell] |= cards
+
+        wins = []
+        for pattern_index in sorted({index for cell in cells for index in self.cell_patterns[cell]}):
+            name, pattern_cells = self.patterns[pattern_index]
+            complete = -1
+            for cell in pattern_cells:
+                complete &= self.called_cells[cell]
+            new = complete & ~self.completed[pattern_index]
+            if not new:
+                continue
+            self.completed[pattern_index] |= new
+            wins.extend(Win(self.card_ids[card_number], name) for card_number in _bit_indices(new))
+        return wins
+
+
+class CallerIndex:
+    """Track called tiles across all issued cards and report new winners on each call."""
+
+    def __init__(self, cards: Iterable[RecordedCard]) -> None:
+        """Index the issued cards. Free center tiles count as called from the start.
+
+        Args:
+            cards: Issued cards as (card ID, grid) tuples, of any grid sizes.
+        """
+        cards_by_size: dict[int, list[RecordedCard]] = {}
+        for card in cards:
+            cards_by_size.setdefault(len(card[1]), []).append(card)
+        self._by_size = {size: _GridSizeIndex(size, sized_cards) for size, sized_cards in cards_by_size.items()}
+        self.called: list[str] = []
+        self.call(FREE_TILE)
+        self.called.clear()
+
+    @property
+    def card_count(self) -> int:
+        """Number of indexed cards."""
+        return sum(len(size_index.card_ids) for size_index in self._by_size.values())
+
+    @property
+    def tiles(self) -> list[str]:
+        """All tiles on any indexed card, sorted."""
+        return sorted({tile for size_index in self._by_size.values() for tile in size_index.tile_cells} - {FREE_TILE})
+
+    def call(self, tile: str) -> list[Win]:
+        """Call a tile.
+
+        Args:
+            tile: Tile value called by the host.
+
+        Returns:
+            Patterns completed by this call, grouped by card. Calling a tile again
+            completes nothing.
+        """
+        if tile in self.called:
+            return []
+        self.called.append(tile)
+        wins = [win for size_index in self._by_size.values() for win in size_index.call(tile)]
+        return sorted(wins, key=lambda win: win.card_id)
+
+
+def show_wins(wins: list[Win]) -> None:
+    """Print the patterns completed by a call.
+
+    Args:
+        wins: Completed patterns.
+    """
+    patterns_by_card: dict[str, list[str]] = {}
+    for win in wins:
+        patterns_by_card.setdefault(win.card_id, []).append(win.pattern)
+
+    table = Table(title=f"🎉 {len(patterns_by_card)} card(s) completed a pattern")
+    table.add_column("Card", style="cyan")
+    table.add_column("Patterns", style="green")
+    for card_id, patterns in patterns_by_card.items():
+        table.add_row(card_id, ", ".join(patterns))
+    console.print(table)
+
+
+def call_tile(index: CallerIndex, tile: str) -> None:
+    """Call a tile and print the result.
+
+    Args:
+        index: Index of the issued cards.
+        tile: Tile value called by the host.
+    """
+    if tile in index.called:
+        console.print(f"[yellow]Already called:[/] {tile}")
+        return
+
+    start_time = time.perf_counter()
+    wins = index.call(tile)
+    elapsed_us = (time.perf_counter() - start_time) * 1_000_000
+
+    console.print(f"[bold]Call {len(index.called)}:[/] {tile} [dim]({elapsed_us:.0f} µs)[/]")
+    if wins:
+        show_wins(wins)
+
+
+@click.command()
+@click.argument("grids_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--calls",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Replay called tiles from a file (one per line) before prompting for more",
+    default=None,
+)
+@click.option(
+    "--no-interactive",
+    is_flag=True,
+    help="Only replay the --calls file, without prompting for more calls",
+    default=False,
+)
+def main(grids_file: Path, calls: Path | None, no_interactive: bool):
+    """Report the winning cards as tiles are called.
+
+    GRIDS_FILE is the file written by create-bingo-card --record-grids.
+
+    Args:
+        grids_file: Path to the recorded grids of the issued cards.
+        calls: Optional file of called tiles to replay.
+        no_interactive: Whether to skip prompting for calls.
+    """
+    start_time = time.perf_counter()
+    index = CallerIndex(load_recorded_cards(grids_file))
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    console.print(
+        f"[bold]Indexed[/] [green]{index.card_count}[/] [bold]cards with[/] "
+        f"[green]{len(index.tiles)}[/] [bold]tiles in {elapsed_ms:.0f} ms[/]"
+    )
+
+    if calls is not None:
+        for line in calls.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                call_tile(index, line.strip())
+
+    if no_interactive:
+        return
+
+    known_tiles = set(index.tiles)
+    while True:
+        uncalled = [tile for tile in index.tiles if tile not in index.called]
+        tile = questionary.autocomplete("Called tile (empty to stop):", choices=uncalled).ask()
+        if not tile:
+            break
+        if tile.strip() not in known_tiles:
+            console.print(f"[yellow]Not on any card:[/] {tile.strip()}")
+        call_tile(index, tile.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Output destinations for rendered bingo cards.
+
+Cards can be written as plain HTML files, as gzip-precompressed ``.html.gz`` files for
+static hosting, or streamed straight into a ``.zip`` / ``.tar.gz`` archive without any
+intermediate files on disk.
+"""
+
+import abc
+import gzip
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar")
+
+# Fixed timestamps, so identical cards always give byte-identical outputs
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # Earliest date zip can store
+GZIP_TAR_MTIME = 0  # Unix time of gzip headers and tar members
+
+
+class CardWriter(abc.ABC):
+    """Base class for destinations that rendered bingo cards are written to.
+
+    Writers are context managers; the destination is finalized when the context exits.
+    """
+
+    def __init__(self) -> None:
+        # Number of bytes each written card occupies in the destination
+        self.sizes: dict[Path, int] = {}
+
+    def target_path(self, output_file: Path) -> Path:
+        """Get the path identifying a card once it is written.
+
+        Args:
+            output_file: Path the card would have as a standalone HTML file.
+
+        Returns:
+            Path of the written card.
+        """
+        return output_file
+
+    @abc.abstractmethod
+    def write(self, output_file: Path, html_str: str) -> Path:
+        """Write a rendered card.
+
+        Args:
+            output_file: Path the card would have as a standalone HTML file.
+            html_str: Rendered HTML document.
+
+        Returns:
+            Path identifying the written card.
+        """
+
+    def close(self) -> None:  # noqa: B027 - optional hook, most writers have nothing to finalize
+        """Finalize the destination."""
+
+    def __enter__(self) -> "CardWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DirectoryWriter(CardWriter):
+    """Write each card as a standalone HTML file."""
+
+    def write(self, output_file: Path, html_str: str) -> Path:
+        with output_file.open(mode="w", encoding="utf-8") as f:
+            f.write(html_str)
+        self.sizes[output_file] = output_file.stat().st_size
+        return output_file
+
+
+class GzipDirectoryWriter(CardWriter):
+    """Write each card as a gzip-precompressed ``.html.gz`` file for static hosting."""
+
+    def target_path(self, output_file: Path) -> Path:
+        return output_file.with_name(output_file.name + ".gz")
+
+    def write(self, output_file: Path, html_str: str) -> Path:
+        gz_file = self.target_path(output_file)
+        with gz_file.open(mode="wb") as raw, gzip.GzipFile(
+            filename=output_file.name, mode="wb", fileobj=raw, compresslevel=9, mtime=GZIP_TAR_MTIME
+        ) as f:
+            f.write(html_str.encode("utf-8"))
+        self.sizes[gz_file] = gz_file.stat().st_size
+        return gz_file
+
+
+class ZipArchiveWriter(CardWriter):
+    """Stream cards into a deflate-compressed zip archive."""
+
+    def __init__(self, archive_path: Path) -> None:
+        super().__init__()
+        self.archive_path = archive_path
+        self._zip = zipfile.ZipFile(
+            archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=9
+        )
+
+    def target_path(self, output_file: Path) -> Path:
+        return self.archive_path / output_file.name
+
+    def write(self, output_file: Path, html_str: str) -> Path:
+        info = zipfile.ZipInfo(output_file.name, date_time=ZIP_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with self._zip.open(info, mode="w") as f:
+            f.write(html_str.encode("utf-8"))
+        member = self.target_path(output_file)
+        self.sizes[member] = info.compress_size
+        return member
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarArchiveWriter(CardWriter):
+    """Stream cards into a tar archive, gzip-compressed for ``.tar.gz`` / ``.tgz``."""
+
+    def __init__(self, archive_path: Path) -> None:
+        super().__init__()
+        self.archive_path = archive_path
+        self._raw = archive_path.open(mode="wb")
+        self._gzip: gzip.GzipFile | None = None
+        if archive_path.name.lower().endswith(".tar"):
+            self._tar = tarfile.open(fileobj=self._raw, mode="w")
+        else:
+            self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=9, mtime=GZIP_TAR_MTIME)
+            self._tar = tarfile.open(fileobj=self._gzip, mode="w")
+
+    def target_path(self, output_file: Path) -> Path:
+        return self.archive_path / output_file.name
+
+    def write(self, output_file: Path, html_str: str) -> Path:
+        data = html_str.encode("utf-8")
+        info = tarfile.TarInfo(output_file.name)
+        info.size = len(data)
+        info.mtime = GZIP_TAR_MTIME
+        start = self._raw.tell()
+        self._tar.addfile(info, io.BytesIO(data))
+        if self._gzip is not None:
+            # A sync flush emits all pending compressed data without resetting the history,
+            # so the bytes written since start are this card's share of the archive
+            self._gzip.flush()
+        member = self.target_path(output_file)
+        self.sizes[member] = self._raw.tell() - start if self._gzip is not None else len(data)
+        return member
+
+    def close(self) -> None:
+        self._tar.close()
+        if self._gzip is not None:
+            self._gzip.close()
+        self._raw.close()
+
+
+def open_card_writer(archive_path: Path | None = None, gzip_output: bool = False) -> CardWriter:
+    """Create the writer matching the requested output mode.
+
+    Args:
+        archive_path: Optional archive to stream all cards into (.zip, .tar.gz, .tgz or .tar).
+        gzip_output: If True (and no archive is given), write ``.html.gz`` files.
+
+    Returns:
+        CardWriter for the requested destination.
+
+    Raises:
+        ValueError: If the archive has an unsupported extension.
+    """
+    if archive_path is None:
+        return GzipDirectoryWriter() if gzip_output else DirectoryWriter()
+
+    name = archive_path.name.lower()
+    if name.endswith(".zip"):
+        return ZipArchiveWriter(archive_path)
+    if name.endswith((".tar.gz", ".tgz", ".tar")):
+        return TarArchiveWriter(archive_path)
+    raise ValueError(
+        f"Unsupported archive format: {archive_path.name}. "
+        f"Use one of: {', '.join(ARCHIVE_SUFFIXES)}"
+    )
@@ -1,4 +1,7 @@
-import random
+import base64
+import importlib
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +15,37 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn
 from rich.table import Table
 from rich.text import Text
 
-from image_processor import process_all_images
-from themes import Theme, get_theme, list_themes
+import themes
+from bingo_generator import (
+    DEFAULT_TEMPLATE_PATH,
+    get_card_id,
+    get_card_template_data,
+    get_random_bingo_items,
+    load_bingo_data,
+    load_card_template,
+)
+from build_manifest import MANIFEST_NAME, BuildManifest
+from caller import GridRecorder
+from card_writers import CardWriter, DirectoryWriter, open_card_writer
+from file_watcher import PollingFileWatcher
+from font_inliner import build_inline_font_css
+from image_processor import (
+    IMAGE_CONFIGS,
+    process_all_images,
+    slice_background_tiles,
+)
+from print_export import PAGE_LAYOUTS, PAGE_SIZES, export_print_sheets
+from sharding import Checkpoint, CheckpointCard, Shard, batch_header, get_seeded_grid, parse_shard
+from size_report import analyze_card, fit_image_targets, show_size_report
+from themes import Theme, get_theme, list_themes, load_themes_dir
+from tile_layout import find_tile_font
 
 # Initialize rich console
 console = Console()
 
+# Times the image targets are tightened before a card that is over budget is an error
+MAX_FIT_ATTEMPTS = 3
+
 # Configure loguru for errors only - suppress INFO/WARNING to avoid conflicts with progress bars
 logger.remove()
 logger.add(
@@ -25,112 +53,8 @@ logger.add(
     format="{message}",
     level="ERROR"
 )
-
-
-def load_bingo_data(csv_file_path: Path) -> list[str]:
-    """Load bingo tile values from a CSV file.
-
-    Args:
-        csv_file_path: Path to the CSV file containing bingo tile values.
-
-    Returns:
-        List of unique strings representing bingo tile values.
-
-    Raises:
-        FileNotFoundError: If the CSV file does not exist.
-    """
-    if not csv_file_path.exists():
-        logger.error(f"CSV file not found: {csv_file_path}")
-        raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
-
-    with csv_file_path.open(encoding="utf-8") as f:
-        # Read lines, strip whitespace, and filter out empty lines
-        lines = [line.strip() for line in f.readlines()]
-        unique_items = list({line for line in lines if line})
-        return unique_items
-
-
-def escape_quotes(items: list[str]) -> list[str]:
-    """Add escape character to quotes in strings so they are added properly to the HTML.
-
-    Args:
-        items: List of strings that may contain quotes.
-
-    Returns:
-        List of strings with escaped quotes.
-    """
-    return [item.replace('"', '\\"') for item in items]
-
-
-def load_jinja_template(template_path: Path | None = None) -> Template:
-    """Load the bingo Jinja template file.
-
-    Args:
-        template_path: Path to the Jinja template file. If None, defaults to 'bingo.jinja'
-            in the current directory.
-
-    Returns:
-        Jinja Template object loaded from the template file.
-
-    Raises:
-        FileNotFoundError: If the template file does not exist.
-    """
-    if template_path is None:
-        template_path = Path("bingo.jinja").resolve()
-
-    if not template_path.exists():
-        logger.error(f"Template file not found: {template_path}")
-        raise FileNotFoundError(f"Template file not found: {template_path}")
-
-    # Load the jinja template
-    with open(template_path, encoding="utf-8") as f:
-        return Template(f.read())
-
-
-def get_random_bingo_items(items: list[str], free_center: bool = False, tile_size: int = 5) -> list[list[str]]:
-    """Generate a randomized 2D grid of bingo items.
-
-    Args:
-        items: List of possible bingo tile values to choose from.
-        free_center: If True, sets the center tile to 'FREE' (only works with odd tile sizes).
-        tile_size: Number of rows and columns in the bingo grid (default: 5).
-
-    Returns:
-        2D list (list of lists) containing the randomized bingo grid.
-
-    Raises:
-        ValueError: If there aren't enough unique items for the requested tile size,
-            or if trying to set a free center with an even-sized grid.
-    """
-    # Check that there are enough items to support the bingo tile size
-    if len(items) < tile_size ** 2:
-        raise ValueError(
-            f"Not enough unique items in the CSV file "
-            f"for the bingo size {tile_size}x{tile_size}. "
-            f"Need at least {tile_size ** 2}, but only have {len(items)}."
-        )
-
-    # Get randomized list of items. Convert to set to ensure they are unique
-    randomized_items = random.sample(items, tile_size ** 2)
-
-    # Create the bingo data to fill the jinja html table
-    bingo_data = []
-    item_number = 0
-    for _ in range(tile_size):
-        row_data = []
-        for _ in range(tile_size):
-            row_data.append(randomized_items[item_number])
-            item_number += 1
-        bingo_data.append(row_data)
-
-    # Set the center square as FREE
-    if free_center:
-        if tile_size % 2 == 0:
-            raise ValueError("Cannot set center tile with even-sized bingo grid.")
-        center_index = tile_size // 2
-        bingo_data[center_index][center_index] = "FREE"
-
-    return bingo_data
+for module in ("bingo_generator", "font_inliner", "image_processor", "template_minifier"):
+    logger.enable(module)
 
 
 def validate_hex_color(color: str) -> bool:
@@ -169,8 +93,16 @@ def generate_bingo_html_card(
         double_bingo_image_encoding: str,
         super_bingo_image_encoding: str,
         output_file: Path,
-        background_color: str = "#f5f9ff",
+        background_color: str | None = None,
         theme_config: Theme | None = None,
+        template: Template | None = None,
+        writer: CardWriter | None = None,
+        inline_font_css: str | None = None,
+        tile_font: Path | None = None,
+        card_id: str | None = None,
+        minify: bool = False,
+        background_tiles: list[str] | None = None,
+        max_card_kb: float | None = None,
 ) -> Path:
     """Generate the HTML bingo card file using the Jinja template.
 
@@ -183,38 +115,61 @@ def generate_bingo_html_card(
         double_bingo_image_encoding: Base64-encoded double bingo celebration image string.
         super_bingo_image_encoding: Base64-encoded super bingo celebration image string.
         output_file: Path where the HTML file should be saved.
-        background_color: Hex color code for the background (default: '#f5f9ff').
+        background_color: Hex color code for the background. Defaults to the theme's
+            background color, or '#f5f9ff' without a theme.
         theme_config: Optional theme configuration dictionary.
+        template: Optional pre-loaded Jinja template, so batches only load it once.
+        writer: Optional destination for the rendered card (e.g. an archive). If None,
+            the card is written to output_file.
+        inline_font_css: Optional @font-face rules embedding the theme fonts (see
+            font_inliner.py). If None, the fonts are loaded from Google Fonts.
+        tile_font: Optional font file used to measure the tile text layout. If None,
+            Pillow's default font is used as an approximation.
+        card_id: Optional identifier the card saves its board state under in the
+            browser. Defaults to a hash of the grid and tile pool.
+        minify: If True and no template is given, render with the minified template for
+            the theme (see template_minifier.py), which is compiled once and cached.
+        background_tiles: Optional base64-encoded pieces of the background image, one
+            per tile in row-major order (see slice_background_tiles). If given, each tile
+            reveals its own piece instead of the whole image being drawn behind the grid.
+        max_card_kb: Optional size budget of the HTML document in KB.
 
     Returns:
         Path to the generated HTML file.
+
+    Raises:
+        ValueError: If the card is larger than max_card_kb.
     """
     # Load jinja template and populate with bingo data
-    template = load_jinja_template()
-
-    # Build template data dictionary
-    template_data = {
-        "initial_items": initial_items,
-        "all_bingo_items": escape_quotes(all_bingo_items),
-        "image": image_encoding,
-        "h_bingo_image": h_bingo_image_encoding,
-        "bingo_image": bingo_image_encoding,
-        "double_bingo_image": double_bingo_image_encoding,
-        "super_bingo_image": super_bingo_image_encoding,
-        "N_options": len(all_bingo_items),
-        "background_color": background_color,
-    }
-
-    # Add theme config if provided
-    if theme_config:
-        template_data["theme"] = theme_config
-
+    if template is None:
+        template = load_card_template(theme_config, minify=minify)
+
+    template_data = get_card_template_data(
+        initial_items=initial_items,
+        all_bingo_items=all_bingo_items,
+        image_encoding=image_encoding,
+        h_bingo_image_encoding=h_bingo_image_encoding,
+        bingo_image_encoding=bingo_image_encoding,
+        double_bingo_image_encoding=double_bingo_image_encoding,
+        super_bingo_image_encoding=super_bingo_image_encoding,
+        background_color=background_color,
+        theme_config=theme_config,
+        inline_font_css=inline_font_css,
+        tile_font=tile_font,
+        card_id=card_id,
+        background_tiles=background_tiles,
+    )
     html_str = template.render(template_data)
+    card_size = len(html_str.encode("utf-8"))
+    if max_card_kb is not None and card_size > max_card_kb * 1024:
+        raise ValueError(
+            f"{output_file.name} is {card_size / 1024:.1f} KB, over the budget of {max_card_kb:.0f} KB"
+        )
 
     # Write output html file
-    with output_file.open(mode="w", encoding="utf-8") as f:
-        f.write(html_str)
-    return output_file
+    if writer is None:
+        writer = DirectoryWriter()
+    return writer.write(output_file, html_str)
 
 
 def prompt_for_input(
@@ -334,26 +289,209 @@ def prompt_for_input(
     return results
 
 
+def get_output_path(cfg: dict[str, Any], tile_size: int, card_number: int = 1) -> Path:
+    """Build the output path for one card of a batch.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        tile_size: Number of rows and columns in the bingo grid.
+        card_number: 1-based number of the card within its tile size batch.
+
+    Returns:
+        Output path with the tile size (and card number for batches) appended to the stem.
+    """
+    base_output = Path(cfg["output"]).expanduser().resolve()
+    stem = f"{base_output.stem}_{tile_size}x{tile_size}"
+    count = cfg.get("count", 1)
+    if count > 1:
+        stem = f"{stem}_{card_number:0{len(str(count))}d}"
+    return base_output.parent / f"{stem}{base_output.suffix}"
+
+
+def get_inline_font_css(
+        cfg: dict[str, Any],
+        all_bingo_items: list[str],
+        theme_config: Theme | None = None,
+) -> str | None:
+    """Build the embedded font CSS if a fonts directory is configured.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        all_bingo_items: List of all possible bingo items.
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        @font-face rules embedding the subset theme fonts, or None to use Google Fonts.
+    """
+    if not cfg.get("fonts_dir"):
+        return None
+    fonts_dir = Path(cfg["fonts_dir"]).expanduser().resolve()
+    return build_inline_font_css(fonts_dir, all_bingo_items, theme_config)
+
+
+def get_tile_font(cfg: dict[str, Any], theme_config: Theme | None = None) -> Path | None:
+    """Find the font file to measure the tile text layout with.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        Path to the tile font in the configured fonts directory, or None.
+    """
+    fonts_dir = Path(cfg["fonts_dir"]).expanduser().resolve() if cfg.get("fonts_dir") else None
+    return find_tile_font(fonts_dir, theme_config)
+
+
+def get_background_tiles(cfg: dict[str, Any], image_encoding: str, tile_size: int) -> list[str] | None:
+    """Get the background sliced per tile if the configuration asks for it.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        image_encoding: Base64-encoded background image.
+        tile_size: Number of rows and columns in the bingo grid.
+
+    Returns:
+        Base64-encoded background pieces in row-major order, or None for a single image.
+    """
+    if not cfg.get("background_tiles"):
+        return None
+    return slice_background_tiles(image_encoding, tile_size)
+
+
+def get_card_numbers(cfg: dict[str, Any]) -> range:
+    """Get the numbers of the cards to generate for each tile size (only this shard's, if sharded).
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+
+    Returns:
+        Range of 1-based card numbers.
+    """
+    return (cfg.get("shard") or Shard(1, 1)).card_numbers(cfg.get("count", 1))
+
+
+def get_card_grid(cfg: dict[str, Any], all_bingo_items: list[str], tile_size: int, card_number: int) -> list[list[str]]:
+    """Get the grid of one card: derived from --master-seed if given, else drawn at random.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        all_bingo_items: List of all bingo items used in the cards.
+        tile_size: Number of rows and columns in the bingo grid.
+        card_number: 1-based number of the card within its tile size batch.
+
+    Returns:
+        2D list containing the card's bingo grid.
+    """
+    if cfg.get("master_seed") is None:
+        return get_random_bingo_items(all_bingo_items, free_center=cfg["free_center"], tile_size=tile_size)
+    return get_seeded_grid(all_bingo_items, cfg["master_seed"], tile_size, card_number, free_center=cfg["free_center"])
+
+
+def apply_size_budget(
+        cfg: dict[str, Any],
+        tile_size: int,
+        template: Template,
+        images: dict[str, str],
+        all_bingo_items: list[str],
+        theme_config: Theme | None = None,
+        inline_font_css: str | None = None,
+        tile_font: Path | None = None,
+) -> tuple[dict[str, str], list[str] | None]:
+    """Show the size breakdown of a sample card and fit the batch in its size budget.
+
+    All cards in a batch embed the same images, theme and tile pool, so one sample card
+    stands for the batch. If the card is over --max-card-kb and --fit-budget is set, the
+    image size targets are tightened and the images processed again.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        tile_size: Number of rows and columns in the bingo grid.
+        template: Template the cards are rendered with.
+        images: Base64-encoded images of the batch.
+        all_bingo_items: List of all bingo items used in the cards.
+        theme_config: Optional theme configuration dictionary.
+        inline_font_css: Optional @font-face rules embedding the theme fonts.
+        tile_font: Optional font file used to measure the tile text layout.
+
+    Returns:
+        Tuple of the images and background tiles to use for the batch.
+
+    Raises:
+        ValueError: If the card is over budget and cannot be fitted.
+    """
+    max_card_kb = cfg.get("max_card_kb")
+    if max_card_kb is None and not cfg.get("size_report"):
+        return images, get_background_tiles(cfg, images["background"], tile_size)
+
+    sample_grid = get_random_bingo_items(all_bingo_items, free_center=cfg["free_center"], tile_size=tile_size)
+    attempt = 0
+    while True:
+        background_tiles = get_background_tiles(cfg, images["background"], tile_size)
+        report = analyze_card(template, get_card_template_data(
+            initial_items=sample_grid,
+            all_bingo_items=all_bingo_items,
+            image_encoding=images["background"],
+            h_bingo_image_encoding=images["h_bingo"],
+            bingo_image_encoding=images["bingo"],
+            double_bingo_image_encoding=images["double_bingo"],
+            super_bingo_image_encoding=images["super_bingo"],
+            background_color=cfg["background_color"],
+            theme_config=theme_config,
+            inline_font_css=inline_font_css,
+            tile_font=tile_font,
+            background_tiles=background_tiles,
+        ))
+        over_budget = max_card_kb is not None and report.total_size > max_card_kb * 1024
+        if cfg.get("size_report") or over_budget:
+            show_size_report(report, f"{tile_size}x{tile_size} card size", console, max_card_kb)
+        if not over_budget:
+            return images, background_tiles
+
+        message = f"{tile_size}x{tile_size} cards are {report.total_size / 1024:.1f} KB, over the budget of {max_card_kb:.0f} KB"
+        if not cfg.get("fit_budget"):
+            raise ValueError(f"{message}. Use --fit-budget to shrink the images to fit")
+        if cfg.get("no_downscaling"):
+            raise ValueError(f"{message}. --fit-budget needs image scaling, remove --no-down-scaling")
+        if attempt == MAX_FIT_ATTEMPTS:
+            raise ValueError(f"{message} after shrinking the images {MAX_FIT_ATTEMPTS} times")
+
+        targets = fit_image_targets(report, max_card_kb)
+        console.print(
+            "[yellow]Over budget:[/] shrinking images to "
+            + ", ".join(f"{img_type} {target_kb:.0f} KB" for img_type, target_kb in targets.items())
+        )
+        images = process_all_images(cfg, target_sizes_kb=targets)
+        attempt += 1
+
+
 def generate_bingo_card(
         cfg: dict[str, Any],
         tile_size: int,
-        theme_config: Theme | None = None
-) -> Path:
+        theme_config: Theme | None = None,
+        writer: CardWriter | None = None,
+        recorder: GridRecorder | None = None,
+        checkpoint: Checkpoint | None = None,
+) -> list[Path]:
     """
-    Generate a single bingo card with the specified tile size.
+    Generate a batch of bingo cards with the specified tile size.
+
+    The CSV, images and template are loaded once and shared by every card in the batch.
 
     Args:
         cfg: Dictionary containing configuration parameters for the bingo card.
         tile_size: Number of rows and columns in the bingo grid.
+        theme_config: Optional theme configuration dictionary.
+        writer: Optional destination for the rendered cards (e.g. an archive).
+        recorder: Optional recorder the grid of every card is written to, for the caller.
+        checkpoint: Optional checkpoint of the shard; cards it lists as finished are kept
+            and every new card is added to it.
 
     Returns:
-        Path to the generated HTML file.
+        Paths to the generated HTML files.
     """
-    # Prepare output filename with tile size suffix
-    base_output = Path(cfg["output"]).expanduser().resolve()
-    stem = base_output.stem
-    suffix = base_output.suffix
-    output_with_size = base_output.parent / f"{stem}_{tile_size}x{tile_size}{suffix}"
+    card_numbers = get_card_numbers(cfg)
+    count = len(card_numbers)
 
     with Progress(
             SpinnerColumn(),
@@ -363,7 +501,7 @@ def generate_bingo_card(
             console=console
     ) as progress:
         # Set up progress tracking
-        main_task = progress.add_task(f"Generating {tile_size}x{tile_size} bingo card", total=4)
+        main_task = progress.add_task(f"Generating {tile_size}x{tile_size} bingo card", total=2 + count)
 
         # Load data
         progress.update(main_task, description="Loading bingo values")
@@ -371,41 +509,274 @@ def generate_bingo_card(
         all_bingo_items = load_bingo_data(csv_file_path)
         progress.advance(main_task)
 
-        # Generate random grid
-        progress.update(main_task, description=f"Creating {tile_size}x{tile_size} bingo grid")
-        initial_items = get_random_bingo_items(all_bingo_items, free_center=cfg["free_center"], tile_size=tile_size)
-        progress.advance(main_task)
-
         # Process all images with progress updates
         progress.update(main_task, description="Processing images")
         images = process_all_images(cfg, progress_task=main_task, progress_tracker=progress)
         progress.advance(main_task)
 
-        # Generate HTML
-        progress.update(main_task, description="Generating HTML bingo card")
-        bingo_file = generate_bingo_html_card(
-            initial_items=initial_items,
-            all_bingo_items=all_bingo_items,
-            image_encoding=images["background"],
-            h_bingo_image_encoding=images["h_bingo"],
-            bingo_image_encoding=images["bingo"],
-            double_bingo_image_encoding=images["double_bingo"],
-            super_bingo_image_encoding=images["super_bingo"],
-            output_file=output_with_size,
-            background_color=cfg["background_color"],
-            theme_config=theme_config,
+        template = load_card_template(theme_config, minify=cfg.get("minify", False))
+        inline_font_css = get_inline_font_css(cfg, all_bingo_items, theme_config)
+        tile_font = get_tile_font(cfg, theme_config)
+        images, background_tiles = apply_size_budget(
+            cfg, tile_size, template, images, all_bingo_items, theme_config, inline_font_css, tile_font
         )
-        progress.advance(main_task)
+        bingo_files = []
+        for position, card_number in enumerate(card_numbers, start=1):
+            progress.update(
+                main_task,
+                description=f"Generating {tile_size}x{tile_size} bingo card ({position}/{count})"
+            )
+            finished = checkpoint.finished(tile_size, card_number) if checkpoint is not None else None
+            if finished is not None:
+                # Written by an earlier, interrupted run of this shard
+                if recorder is not None:
+                    recorder.record(finished.card_id, finished.grid)
+                bingo_files.append(Path(finished.file))
+                progress.advance(main_task)
+                continue
+
+            # Generate grid and HTML
+            initial_items = get_card_grid(cfg, all_bingo_items, tile_size, card_number)
+            card_id = get_card_id(initial_items, all_bingo_items)
+            if recorder is not None:
+                recorder.record(card_id, initial_items)
+            bingo_file = generate_bingo_html_card(
+                initial_items=initial_items,
+                all_bingo_items=all_bingo_items,
+                image_encoding=images["background"],
+                h_bingo_image_encoding=images["h_bingo"],
+                bingo_image_encoding=images["bingo"],
+                double_bingo_image_encoding=images["double_bingo"],
+                super_bingo_image_encoding=images["super_bingo"],
+                output_file=get_output_path(cfg, tile_size, card_number),
+                background_color=cfg["background_color"],
+                theme_config=theme_config,
+                template=template,
+                writer=writer,
+                inline_font_css=inline_font_css,
+                tile_font=tile_font,
+                card_id=card_id,
+                background_tiles=background_tiles,
+                max_card_kb=cfg.get("max_card_kb"),
+            )
+            bingo_files.append(bingo_file)
+            if checkpoint is not None:
+                checkpoint.record(CheckpointCard(tile_size, card_number, card_id, initial_items, str(bingo_file)))
+            progress.advance(main_task)
+
+    return bingo_files
+
 
-    return bingo_file
+def export_print_cards(
+        cfg: dict[str, Any],
+        tile_sizes: list[int],
+        theme_config: Theme | None = None,
+        recorder: GridRecorder | None = None,
+) -> list[Path]:
+    """Render the requested cards as printable sheets instead of HTML.
 
+    Grids are created lazily as pages are rendered, so any number of cards can be printed.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        tile_sizes: Tile sizes to print cards for.
+        theme_config: Optional theme configuration dictionary.
+        recorder: Optional recorder the grid of every card is written to, for the caller.
 
-def show_summary(generated_files: list[Path], all_bingo_items: list[str]) -> None:
+    Returns:
+        Paths of the written PDF or PNG files.
+    """
+    csv_file_path = Path(cfg["csv_file"]).expanduser().resolve()
+    all_bingo_items = load_bingo_data(csv_file_path)
+    with console.status("Processing images"):
+        images = process_all_images(cfg)
+    background = base64.b64decode(images["background"])
+    font_path = get_tile_font(cfg, theme_config)
+    base_output = Path(cfg["print_export"]).expanduser().resolve()
+    card_numbers = get_card_numbers(cfg)
+    count = len(card_numbers)
+
+    def cards(tile_size: int):
+        for card_number in card_numbers:
+            grid = get_card_grid(cfg, all_bingo_items, tile_size, card_number)
+            card_id = get_card_id(grid, all_bingo_items)
+            if recorder is not None:
+                recorder.record(card_id, grid)
+            yield card_id, grid
+
+    written = []
+    with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console
+    ) as progress:
+        for size in tile_sizes:
+            task = progress.add_task(f"Printing {size}x{size} bingo cards", total=count)
+            written.extend(export_print_sheets(
+                cards(size),
+                base_output.with_name(f"{base_output.stem}_{size}x{size}{base_output.suffix}"),
+                theme_config=theme_config,
+                background=background,
+                font_path=font_path,
+                cards_per_page=cfg["cards_per_page"],
+                page_size=cfg["page_size"],
+                on_page=lambda page_cards, task=task: progress.advance(task, page_cards),
+            ))
+    return written
+
+
+def watch_bingo_cards(cfg: dict[str, Any], tile_sizes: list[int], theme_name: str) -> None:
+    """Keep regenerating bingo cards while the CSV, images, template or themes are edited.
+
+    Loaded tiles, processed images, the template and the theme are kept in memory, and a
+    change only redoes the stage it affects (e.g. a CSV edit does not reprocess images)
+    before the cards are re-rendered. Images go through the same steps as a one-shot build
+    (prepared variants from --assets-manifest, then the --max-card-kb budget). Unless a
+    background color other than the theme's was chosen, the card follows theme edits to
+    the background color. Runs until interrupted with Ctrl+C.
+
+    Args:
+        cfg: Dictionary containing configuration parameters for the bingo card.
+        tile_sizes: Tile sizes to generate a card for.
+        theme_name: Name of the theme, re-read from themes.py and the theme files whenever
+            they change.
+    """
+    csv_file_path = Path(cfg["csv_file"]).expanduser().resolve()
+    template_path = DEFAULT_TEMPLATE_PATH.resolve()
+    themes_path = Path(themes.__file__).resolve()
+    themes_dir = Path(cfg["themes_dir"]).expanduser().resolve() if cfg.get("themes_dir") else None
+    image_paths = {
+        key: Path(cfg[config_key]).expanduser().resolve() for key, config_key, _ in IMAGE_CONFIGS
+    }
+
+    # Warm state shared by all rebuilds
+    all_bingo_items = load_bingo_data(csv_file_path)
+    grids = {
+        size: get_random_bingo_items(all_bingo_items, free_center=cfg["free_center"], tile_size=size)
+        for size in tile_sizes
+    }
+    with console.status("Processing images"):
+        images = process_all_images(cfg)
+    theme_config = themes.get_theme(theme_name)
+    template = load_card_template(theme_config, cfg.get("minify", False), template_path)
+    inline_font_css = get_inline_font_css(cfg, all_bingo_items, theme_config)
+    tile_font = get_tile_font(cfg, theme_config)
+    # A background color that differs from the theme's was chosen by the user, and is kept
+    chosen_color = cfg["background_color"]
+    if chosen_color.lower() == theme_config["colors"]["background"].lower():
+        chosen_color = None
+
+    # Images fitted to the --max-card-kb budget for each grid size. They are kept while they
+    # still fit, so edits to the tiles or theme don't shrink the images all over again
+    fitted_images: dict[int, dict[str, str]] = {}
+
+    def render_cards() -> None:
+        for size in tile_sizes:
+            size_images, background_tiles = apply_size_budget(
+                cfg, size, template, fitted_images.get(size, images), all_bingo_items,
+                theme_config, inline_font_css, tile_font,
+            )
+            fitted_images[size] = size_images
+            generate_bingo_html_card(
+                initial_items=grids[size],
+                all_bingo_items=all_bingo_items,
+                image_encoding=size_images["background"],
+                h_bingo_image_encoding=size_images["h_bingo"],
+                bingo_image_encoding=size_images["bingo"],
+                double_bingo_image_encoding=size_images["double_bingo"],
+                super_bingo_image_encoding=size_images["super_bingo"],
+                output_file=get_output_path(cfg, size),
+                background_color=chosen_color or theme_config["colors"]["background"],
+                theme_config=theme_config,
+                template=template,
+                inline_font_css=inline_font_css,
+                tile_font=tile_font,
+                # Cached per background and size, so only a changed image is sliced again
+                background_tiles=background_tiles,
+                max_card_kb=cfg.get("max_card_kb"),
+            )
+
+    render_cards()
+    for size in tile_sizes:
+        console.print(f"[bold]Generated[/] [cyan]{get_output_path(cfg, size)}[/]")
+
+    # Theme files added to --themes-dir while watching are picked up as well
+    watcher = PollingFileWatcher(
+        [csv_file_path, template_path, themes_path, *image_paths.values()],
+        directories={themes_dir: (".toml", ".json")} if themes_dir else None,
+    )
+    console.print("\n[bold]👀 Watching for changes...[/] (press Ctrl+C to stop)")
+
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            start_time = time.perf_counter()
+            stages = []
+
+            try:
+                if csv_file_path in changed:
+                    stages.append("tiles")
+                    all_bingo_items = load_bingo_data(csv_file_path)
+                    grids = {
+                        size: get_random_bingo_items(
+                            all_bingo_items, free_center=cfg["free_center"], tile_size=size
+                        )
+                        for size in tile_sizes
+                    }
+
+                changed_images = [key for key, path in image_paths.items() if path in changed]
+                if changed_images:
+                    stages.extend(f"{key} image" for key in changed_images)
+                    images.update(process_all_images(cfg, keys=changed_images))
+                    fitted_images.clear()
+
+                theme_changed = themes_path in changed or any(
+                    themes_dir in (path, path.parent) for path in changed
+                )
+                if theme_changed:
+                    stages.append("theme")
+                    importlib.reload(themes)
+                    if themes_dir is not None:
+                        themes.load_themes_dir(themes_dir)
+                    theme_config = themes.get_theme(theme_name)
+
+                if template_path in changed or (theme_changed and cfg.get("minify")):
+                    # The minified template has the theme baked in
+                    stages.append("template")
+                    template = load_card_template(theme_config, cfg.get("minify", False), template_path)
+
+                if not stages:
+                    continue
+                if "tiles" in stages or "theme" in stages:
+                    # Subsets are cached, so this only does work if the glyph set changed
+                    inline_font_css = get_inline_font_css(cfg, all_bingo_items, theme_config)
+                    tile_font = get_tile_font(cfg, theme_config)
+                render_cards()
+            except Exception as e:
+                # Keep watching so the next save can fix the problem
+                console.print(f"[bold red]❌ Error:[/] {e}")
+                continue
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            console.print(f"[green]✓[/] Rebuilt ({', '.join(stages)}) in {elapsed_ms:.0f} ms")
+    except KeyboardInterrupt:
+        console.print("\n[bold]Stopped watching.[/]")
+
+
+def show_summary(
+        generated_files: list[Path],
+        all_bingo_items: list[str],
+        file_sizes: dict[Path, int] | None = None,
+) -> None:
     """Display a summary of the generated bingo cards.
 
     Args:
         generated_files: List of paths to the generated HTML files.
         all_bingo_items: List of all bingo items used in the cards.
+        file_sizes: Optional sizes in bytes for outputs that are not plain files on disk
+            (e.g. archive members).
     """
     # Create a nice table showing the results
     table = Table(title="Generated Bingo Cards")
@@ -414,7 +785,10 @@ def show_summary(generated_files: list[Path], all_bingo_items: list[str]) -> Non
     table.add_column("Items", style="green")
 
     for file_path in generated_files:
-        file_size = file_path.stat().st_size / 1024  # Size in KB
+        if file_sizes and file_path in file_sizes:
+            file_size = file_sizes[file_path] / 1024  # Size in KB
+        else:
+            file_size = file_path.stat().st_size / 1024  # Size in KB
         table.add_row(
             str(file_path),
             f"{file_size:.1f} KB",
@@ -422,10 +796,34 @@ def show_summary(generated_files: list[Path], all_bingo_items: list[str]) -> Non
         )
 
     console.print(table)
+    if len(generated_files) > 1:
+        total_size = sum(file_sizes.values()) if file_sizes else sum(f.stat().st_size for f in generated_files)
+        console.print(f"[bold]Total:[/] {len(generated_files)} card(s), {total_size / 1024:.1f} KB")
     console.print("\n[bold green]✅ Successfully generated bingo card(s)![/]")
     console.print("[italic]Open the file(s) in a web browser to play![/]")
 
 
+def complete_theme_name(ctx: click.Context, param: click.Parameter, incomplete: str) -> list[str]:
+    """Complete --theme with the built-in themes and those in --themes-dir (if given first)."""
+    themes_dir = ctx.params.get("themes_dir")
+    if themes_dir:
+        try:
+            load_themes_dir(Path(themes_dir))
+        except (OSError, ValueError):
+            pass
+    return [name for name in list_themes() if name.startswith(incomplete)]
+
+
+def validate_shard(ctx: click.Context, param: click.Parameter, value: str | None) -> Shard | None:
+    """Parse --shard into a Shard."""
+    if value is None:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
 @click.command()
 @click.option(
     "--csv-file",
@@ -493,6 +891,121 @@ def show_summary(generated_files: list[Path], all_bingo_items: list[str]) -> Non
     help="Hex color for the background and tiles (e.g. #0a0a30)",
     default=None,
 )
+@click.option(
+    "--assets-manifest",
+    type=click.Path(exists=True),
+    help="Use image variants precomputed by prepare-assets (manifest file or its directory)",
+    default=None,
+)
+@click.option(
+    "--fonts-dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Embed the theme fonts from this directory, subset to the glyphs used, instead of loading Google Fonts",
+    default=None,
+)
+@click.option(
+    "--count",
+    type=click.IntRange(min=1),
+    help="Number of cards to generate for each tile size",
+    default=1,
+)
+@click.option(
+    "--archive",
+    type=click.Path(dir_okay=False),
+    help="Stream all cards into a single archive instead of separate files (.zip, .tar.gz, .tgz or .tar)",
+    default=None,
+)
+@click.option(
+    "--gzip",
+    "gzip_output",
+    is_flag=True,
+    help="Write gzip-precompressed .html.gz files for static hosting (not with --archive)",
+    default=False,
+)
+@click.option(
+    "--minify",
+    is_flag=True,
+    help="Minify the card's HTML, CSS and JavaScript (the minified template is built once per theme)",
+    default=False,
+)
+@click.option(
+    "--background-tiles",
+    is_flag=True,
+    help="Slice the background image into one piece per tile, so revealing a tile only paints its own piece",
+    default=False,
+)
+@click.option(
+    "--max-card-kb",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Fail if a card's HTML is larger than this many KB (see --fit-budget)",
+    default=None,
+)
+@click.option(
+    "--fit-budget",
+    is_flag=True,
+    help="Shrink the embedded images until cards fit --max-card-kb instead of failing",
+    default=False,
+)
+@click.option(
+    "--size-report",
+    is_flag=True,
+    help="Show how each card's size splits into template, theme, tile pool, fonts and images",
+    default=False,
+)
+@click.option(
+    "--record-grids",
+    type=click.Path(dir_okay=False),
+    help="Write the grid of every generated card to this JSON Lines file, for the bingo-caller console",
+    default=None,
+)
+@click.option(
+    "--master-seed",
+    type=int,
+    help="Derive every card's grid from this seed and its card number, so batches are reproducible",
+    default=None,
+)
+@click.option(
+    "--shard",
+    callback=validate_shard,
+    help="Generate only shard i of n of the --count cards (e.g. 2/4); needs --master-seed",
+    default=None,
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="Record finished cards in this file and skip them when an interrupted run is resumed",
+    default=None,
+)
+@click.option(
+    "--print-export",
+    type=click.Path(dir_okay=False),
+    help="Write printable sheets instead of HTML cards: a .pdf file, or a .png path for one image per page",
+    default=None,
+)
+@click.option(
+    "--cards-per-page",
+    type=click.Choice([str(n) for n in PAGE_LAYOUTS]),
+    help="Number of cards on each printed page",
+    default="4",
+)
+@click.option(
+    "--page-size",
+    type=click.Choice(list(PAGE_SIZES)),
+    help="Paper size of printed pages",
+    default="letter",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate all cards even if their inputs have not changed since the last run",
+    default=False,
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and regenerate the card(s) whenever the CSV, images, template or themes change",
+    default=False,
+)
 @click.option(
     "--no-interactive",
     is_flag=True,
@@ -501,9 +1014,16 @@ def show_summary(generated_files: list[Path], all_bingo_items: list[str]) -> Non
 )
 @click.option(
     "--theme",
-    type=click.Choice(list_themes()),
-    help="Theme to use for the bingo card (alien or ghost)",
+    type=str,
+    help="Theme to use for the bingo card (a built-in theme or one from --themes-dir)",
     default="alien",
+    shell_complete=complete_theme_name,
+)
+@click.option(
+    "--themes-dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Load additional themes from the .toml and .json files in this directory",
+    default=None,
 )
 def main(
         csv_file: str | None,
@@ -517,8 +1037,28 @@ def main(
         output: str | None,
         no_down_scaling: bool,
         background_color: str | None,
+        assets_manifest: str | None,
+        fonts_dir: str | None,
+        count: int,
+        archive: str | None,
+        gzip_output: bool,
+        minify: bool,
+        background_tiles: bool,
+        max_card_kb: float | None,
+        fit_budget: bool,
+        size_report: bool,
+        record_grids: str | None,
+        master_seed: int | None,
+        shard: Shard | None,
+        checkpoint: str | None,
+        print_export: str | None,
+        cards_per_page: str,
+        page_size: str,
+        force: bool,
+        watch: bool,
         no_interactive: bool,
         theme: str,
+        themes_dir: str | None,
 ):
     """Generate a bingo card HTML file from a CSV of tile values and a background image.
 
@@ -534,11 +1074,55 @@ def main(
         output: Output HTML file path.
         no_down_scaling: Whether to disable automatic image scaling.
         background_color: Hex color for the background and tiles.
+        assets_manifest: Optional prepare-assets manifest to read processed images from.
+        fonts_dir: Optional directory with theme font files to embed.
+        count: Number of cards to generate for each tile size.
+        archive: Optional archive path to stream all cards into.
+        gzip_output: Whether to write gzip-precompressed .html.gz files.
+        minify: Whether to minify the generated HTML, CSS and JavaScript.
+        background_tiles: Whether to slice the background image into one piece per tile.
+        max_card_kb: Optional size budget of each card's HTML in KB.
+        fit_budget: Whether to shrink the images to fit the budget instead of failing.
+        size_report: Whether to show the size breakdown of each batch of cards.
+        record_grids: Optional JSON Lines path to record the grid of every card to.
+        master_seed: Optional seed the grid of every card is derived from.
+        shard: Optional shard of the batch to generate.
+        checkpoint: Optional checkpoint file to record finished cards in and resume from.
+        print_export: Optional .pdf or .png path to write printable sheets to instead of HTML.
+        cards_per_page: Number of cards on each printed page.
+        page_size: Paper size of printed pages.
+        force: Whether to regenerate cards whose inputs have not changed.
+        watch: Whether to keep regenerating the card(s) as the inputs change.
         no_interactive: Whether to skip interactive prompts and use defaults.
-        theme: Theme to use for the bingo card (alien or ghost).
+        theme: Theme to use for the bingo card.
+        themes_dir: Optional directory with additional theme files.
     """
-    # Get theme configuration
+    # Register theme files, then get theme configuration
+    if themes_dir:
+        try:
+            load_themes_dir(Path(themes_dir))
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--themes-dir") from e
+    if theme not in list_themes():
+        raise click.BadParameter(
+            f"Unknown theme: {theme}. Use one of: {', '.join(list_themes())}", param_hint="--theme"
+        )
     theme_config = get_theme(theme)
+    if (shard or checkpoint) and master_seed is None:
+        raise click.BadParameter(
+            "Sharded and resumed batches need --master-seed, so every run gets the same cards",
+            param_hint="--master-seed",
+        )
+    if gzip_output and archive:
+        raise click.BadParameter(
+            "--gzip compresses separate HTML files; use a .zip, .tar.gz or .tgz --archive to compress an archive",
+            param_hint="--gzip",
+        )
+    if checkpoint and (print_export or archive or watch):
+        raise click.BadParameter(
+            "Only batches of separate HTML files can be resumed, not --print-export, --archive or --watch",
+            param_hint="--checkpoint",
+        )
 
     # Default values
     defaults = {
@@ -606,6 +1190,26 @@ def main(
         # Now prompt for any missing values
         inputs = prompt_for_input(defaults)
 
+    # Batch and output options are only set from the command line
+    inputs["assets_manifest"] = assets_manifest
+    inputs["fonts_dir"] = fonts_dir
+    inputs["count"] = count
+    inputs["archive"] = archive
+    inputs["gzip_output"] = gzip_output
+    inputs["minify"] = minify
+    inputs["background_tiles"] = background_tiles
+    inputs["max_card_kb"] = max_card_kb
+    inputs["fit_budget"] = fit_budget
+    inputs["size_report"] = size_report
+    inputs["record_grids"] = record_grids
+    inputs["master_seed"] = master_seed
+    inputs["shard"] = shard
+    inputs["checkpoint"] = checkpoint
+    inputs["print_export"] = print_export
+    inputs["cards_per_page"] = int(cards_per_page)
+    inputs["page_size"] = page_size
+    inputs["themes_dir"] = themes_dir
+
     try:
         # Validate the background color
         if not validate_hex_color(inputs["background_color"]):
@@ -638,15 +1242,98 @@ def main(
             )
             return
 
+        if watch:
+            watch_bingo_cards({**inputs, "count": 1}, tile_sizes_to_generate, theme)
+            return
+
+        record_path = Path(inputs["record_grids"]).expanduser().resolve() if inputs["record_grids"] else None
+        if record_path is not None:
+            # Grids are drawn at random, so only cards generated in this run match the record
+            force = True
+        if size_report:
+            # The report is taken while cards are generated
+            force = True
+
+        if inputs["print_export"]:
+            with (GridRecorder(record_path) if record_path else nullcontext()) as recorder:
+                printed_files = export_print_cards(inputs, tile_sizes_to_generate, theme_config, recorder)
+            for printed_file in printed_files:
+                console.print(
+                    f"[bold]Wrote[/] [cyan]{printed_file}[/] ({printed_file.stat().st_size / 1024:.1f} KB)"
+                )
+            if recorder is not None:
+                console.print(f"[bold]Recorded[/] {recorder.count} card grids in [cyan]{record_path}[/]")
+            console.print("\n[bold green]✅ Printable bingo cards ready![/]")
+            return
+
+        # Inputs of previous runs, used to skip cards whose inputs have not changed
+        archive_path = Path(inputs["archive"]).expanduser().resolve() if inputs["archive"] else None
+        output_dir = archive_path.parent if archive_path else get_output_path(inputs, max_tile_size).parent
+        manifest = BuildManifest(output_dir / MANIFEST_NAME)
+        template_path = DEFAULT_TEMPLATE_PATH.resolve()
+        input_keys = {
+            size: manifest.input_key(inputs, size, template_path, theme_config)
+            for size in tile_sizes_to_generate
+        }
+
+        # An archive is rewritten as a whole, so it is only skipped if every batch is unchanged
+        if archive_path is not None:
+            archive_key = "+".join(input_keys[size] for size in tile_sizes_to_generate)
+            if not force and manifest.is_up_to_date([archive_path], archive_key):
+                console.print(f"\n[green]✓[/] [cyan]{archive_path}[/] is up to date, nothing to generate")
+                return
+
+        # Cards finished by earlier runs of this shard, for resuming an interrupted batch
+        card_checkpoint = None
+        if inputs["checkpoint"]:
+            card_checkpoint = Checkpoint(
+                Path(inputs["checkpoint"]).expanduser().resolve(),
+                batch_header(master_seed, inputs["shard"] or Shard(1, 1), inputs["count"], input_keys),
+            )
+
         # Generate bingo cards
         generated_files = []
-        for size in tile_sizes_to_generate:
-            console.print(f"\n[bold]Generating {size}x{size} bingo card...[/]")
-            bingo_file = generate_bingo_card(inputs, size, theme_config)
-            generated_files.append(bingo_file)
+        with (
+            open_card_writer(archive_path, gzip_output=inputs["gzip_output"]) as writer,
+            (GridRecorder(record_path) if record_path else nullcontext()) as recorder,
+            card_checkpoint or nullcontext(),
+        ):
+            for size in tile_sizes_to_generate:
+                outputs = [
+                    writer.target_path(get_output_path(inputs, size, card_number))
+                    for card_number in get_card_numbers(inputs)
+                ]
+                # A checkpoint skips finished cards itself and has to list every card of the shard
+                if (
+                    archive_path is None
+                    and card_checkpoint is None
+                    and not force
+                    and manifest.is_up_to_date(outputs, input_keys[size])
+                ):
+                    console.print(f"\n[green]✓[/] {size}x{size} bingo card(s) up to date, skipping")
+                    generated_files.extend(outputs)
+                    continue
+
+                console.print(f"\n[bold]Generating {size}x{size} bingo card...[/]")
+                bingo_files = generate_bingo_card(
+                    inputs, size, theme_config, writer=writer, recorder=recorder, checkpoint=card_checkpoint
+                )
+                generated_files.extend(bingo_files)
+                manifest.record(bingo_files, input_keys[size])
+
+        if archive_path is not None:
+            manifest.record([archive_path], archive_key)
+        manifest.save()
 
         # Show summary
-        show_summary(generated_files, all_bingo_items)
+        show_summary(generated_files, all_bingo_items, file_sizes=writer.sizes)
+        if archive_path is not None:
+            console.print(
+                f"[bold]Archive:[/] [cyan]{archive_path}[/] "
+                f"({archive_path.stat().st_size / 1024:.1f} KB)"
+            )
+        if recorder is not None:
+            console.print(f"[bold]Recorded[/] {recorder.count} card grids in [cyan]{record_path}[/]")
 
     except Exception as e:
         console.print(f"[bold red]❌ Error:[/] {e}")
@@ -0,0 +1,114 @@
+"""Polling file watcher used by the bingo card watch mode."""
+
+import time
+from pathlib import Path
+
+# (mtime_ns, size) of a file, or None if it does not exist (e.g. mid-save by an editor)
+FileSignature = tuple[int, int] | None
+
+
+class PollingFileWatcher:
+    """Watch a set of files for changes by polling their modification times.
+
+    Polling keeps the watcher dependency-free and works the same on every platform and
+    on network or container-mounted file systems where inotify events are unreliable.
+    """
+
+    def __init__(
+            self,
+            paths: list[Path],
+            poll_interval: float = 0.05,
+            debounce: float = 0.05,
+            directories: dict[Path, tuple[str, ...]] | None = None,
+    ) -> None:
+        """Create a watcher.
+
+        Args:
+            paths: Files to watch.
+            poll_interval: Seconds between polls.
+            debounce: Seconds without further changes before a batch of changes is reported,
+                so that editors writing a file in several steps only trigger one rebuild.
+            directories: Directories whose files with the given suffixes (e.g. ('.toml',))
+                are watched as well, including files added later. A directory is reported
+                as changed when such a file is added or removed.
+        """
+        self.directories = {
+            directory.resolve(): tuple(suffix.lower() for suffix in suffixes)
+            for directory, suffixes in (directories or {}).items()
+        }
+        self._listings = {
+            directory: self._list_directory(directory, suffixes)
+            for directory, suffixes in self.directories.items()
+        }
+        listed = [path for listing in self._listings.values() for path in sorted(listing)]
+        self.paths = list(dict.fromkeys([*(path.resolve() for path in paths), *listed]))
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._signatures = {path: self._signature(path) for path in [*self.paths, *self.directories]}
+
+    @staticmethod
+    def _signature(path: Path) -> FileSignature:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _list_directory(directory: Path, suffixes: tuple[str, ...]) -> frozenset[Path]:
+        try:
+            entries = list(directory.iterdir())
+        except OSError:
+            return frozenset()
+        return frozenset(
+            path.resolve() for path in entries if path.suffix.lower() in suffixes and path.is_file()
+        )
+
+    def poll(self) -> set[Path]:
+        """Check every watched file and directory once.
+
+        Returns:
+            Set of files and directories that changed since the previous poll.
+        """
+        changed = set()
+        for directory, suffixes in self.directories.items():
+            listing = self._list_directory(directory, suffixes)
+            if listing == self._listings[directory]:
+                continue
+            for path in sorted(listing - self._listings[directory]):
+                if path not in self._signatures:
+                    # Unseen so far, so the loop below reports it as changed
+                    self.paths.append(path)
+                    self._signatures[path] = None
+            self._listings[directory] = listing
+            self._signatures[directory] = self._signature(directory)
+            changed.add(directory)
+        for path in self.paths:
+            signature = self._signature(path)
+            if signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed.add(path)
+        return changed
+
+    def wait_for_changes(self) -> set[Path]:
+        """Block until files change and the changes have settled.
+
+        Returns:
+            Set of files that changed. Files that are missing once the changes have settled
+            are left out, as they cannot be rebuilt from.
+        """
+        changed = set()
+        while not changed:
+            time.sleep(self.poll_interval)
+            changed = self.poll()
+
+        # Keep collecting changes until the files have been quiet for the debounce period
+        last_change = time.monotonic()
+        while time.monotonic() - last_change < self.debounce:
+            time.sleep(self.poll_interval / 2)
+            more_changes = self.poll()
+            if more_changes:
+                changed |= more_changes
+                last_change = time.monotonic()
+
+        return {path for path in changed if self._signatures[path] is not None}
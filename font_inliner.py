@@ -0,0 +1,204 @@
+"""Offline font inlining for bingo cards.
+
+Instead of loading theme fonts from Google Fonts, local font files are subset to exactly
+the glyphs a card can display (tile pool, messages and UI text) and embedded as WOFF2 data
+URIs. Subsets are cached on disk by (font, glyph set) hash so repeated builds skip
+subsetting.
+
+Requires the optional ``fonts`` dependencies (fontTools and brotli):
+``pip install "bingo-card-generator[fonts]"``.
+"""
+
+import base64
+import hashlib
+import re
+from io import BytesIO
+from pathlib import Path
+
+from loguru import logger
+
+from themes import Theme
+
+logger.disable(__name__)  # Enabled by the CLIs
+
+FONT_SUFFIXES = {".ttf", ".otf", ".woff", ".woff2"}
+SUBSET_CACHE_DIR_NAME = ".subset-cache"
+
+# Fonts used by the template when no theme is given
+DEFAULT_FONT_FAMILIES = ["Orbitron", "Exo 2", "Audiowide"]
+
+# Text rendered by the template itself, outside the tile pool and theme messages
+UI_TEXT = (
+    "Bingo Randomize Reset Tiles FREE BINGO! DOUBLE BINGO! H BINGO! You are a God Gamer "
+    "0123456789 .,:;!?'\"()-&/"
+)
+
+
+def _normalize_family(name: str) -> str:
+    return re.sub(r"[\s+_-]", "", name).lower()
+
+
+def find_font_files(fonts_dir: Path, family: str) -> list[Path]:
+    """Find the local font files of a font family.
+
+    Files are matched by the family name before the style suffix, as in the file names of
+    Google Fonts downloads (e.g. 'Exo2-Bold.ttf' or 'Orbitron-VariableFont_wght.ttf').
+
+    Args:
+        fonts_dir: Directory to search (recursively).
+        family: Font family name (e.g. 'Exo 2').
+
+    Returns:
+        Sorted list of matching font files.
+    """
+    target = _normalize_family(family)
+    return sorted(
+        path for path in fonts_dir.rglob("*")
+        if path.suffix.lower() in FONT_SUFFIXES
+        and SUBSET_CACHE_DIR_NAME not in path.parts
+        and _normalize_family(re.split(r"[-_\[]", path.stem)[0]) == target
+    )
+
+
+def get_theme_font_families(theme_config: Theme | None) -> list[str]:
+    """Get the unique font families a theme uses.
+
+    Args:
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        List of font family names.
+    """
+    if theme_config is None:
+        return list(DEFAULT_FONT_FAMILIES)
+    fonts = theme_config["fonts"]
+    return list(dict.fromkeys([fonts["primary"], fonts["secondary"], fonts["accent"]]))
+
+
+def get_glyph_text(all_bingo_items: list[str], theme_config: Theme | None = None) -> str:
+    """Collect every character a card can display.
+
+    Args:
+        all_bingo_items: List of all possible bingo items (any of them can be shown after
+            randomizing).
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        String containing each required character once, sorted.
+    """
+    text = UI_TEXT + "".join(all_bingo_items)
+    if theme_config is not None:
+        text += "".join(theme_config["messages"].values())
+    return "".join(sorted(set(text)))
+
+
+def _load_fonttools():
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError as e:
+        raise ImportError(
+            "Inlining fonts requires fontTools and brotli. "
+            "Install them with: pip install \"bingo-card-generator[fonts]\""
+        ) from e
+    return subset, TTFont
+
+
+def subset_font(font_path: Path, text: str, cache_dir: Path | None = None) -> bytes:
+    """Subset a font to the given characters and encode it as WOFF2.
+
+    Args:
+        font_path: Path to the font file.
+        text: Characters to keep.
+        cache_dir: Optional directory for cached subsets.
+
+    Returns:
+        WOFF2 font bytes.
+    """
+    font_bytes = font_path.read_bytes()
+    key = hashlib.sha256(font_bytes + text.encode("utf-8")).hexdigest()
+    cache_file = cache_dir / f"{key}.woff2" if cache_dir is not None else None
+    if cache_file is not None and cache_file.exists():
+        return cache_file.read_bytes()
+
+    subset, TTFont = _load_fonttools()
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = []
+    options.notdef_outline = True
+    options.hinting = False
+
+    font = TTFont(BytesIO(font_bytes))
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+    buffer = BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    woff2_bytes = buffer.getvalue()
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(woff2_bytes)
+    return woff2_bytes
+
+
+def get_font_face_properties(font_path: Path) -> tuple[str, str]:
+    """Read the CSS font-weight and font-style of a font file.
+
+    Args:
+        font_path: Path to the font file.
+
+    Returns:
+        Tuple of the font-weight (a range for variable fonts) and font-style.
+    """
+    _, TTFont = _load_fonttools()
+    font = TTFont(font_path, lazy=True)
+    weight = str(font["OS/2"].usWeightClass)
+    if "fvar" in font:
+        for axis in font["fvar"].axes:
+            if axis.axisTag == "wght":
+                weight = f"{int(axis.minValue)} {int(axis.maxValue)}"
+    style = "italic" if font["OS/2"].fsSelection & 1 else "normal"
+    return weight, style
+
+
+def build_inline_font_css(
+        fonts_dir: Path,
+        all_bingo_items: list[str],
+        theme_config: Theme | None = None,
+) -> str:
+    """Build @font-face rules embedding subset theme fonts as WOFF2 data URIs.
+
+    Args:
+        fonts_dir: Directory containing the theme's font files.
+        all_bingo_items: List of all possible bingo items.
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        CSS string with one @font-face rule per font file.
+
+    Raises:
+        FileNotFoundError: If no font file is found for one of the theme's font families.
+    """
+    text = get_glyph_text(all_bingo_items, theme_config)
+    cache_dir = fonts_dir / SUBSET_CACHE_DIR_NAME
+
+    rules = []
+    for family in get_theme_font_families(theme_config):
+        font_files = find_font_files(fonts_dir, family)
+        if not font_files:
+            logger.error(f"No font files found for '{family}' in {fonts_dir}")
+            raise FileNotFoundError(f"No font files found for '{family}' in {fonts_dir}")
+
+        for font_path in font_files:
+            weight, style = get_font_face_properties(font_path)
+            encoded = base64.b64encode(subset_font(font_path, text, cache_dir)).decode("ascii")
+            rules.append(
+                f"@font-face {{ font-family: '{family}'; "
+                f"src: url(data:font/woff2;base64,{encoded}) format('woff2'); "
+                f"font-weight: {weight}; font-style: {style}; font-display: swap; }}"
+            )
+    return "\n".join(rules)
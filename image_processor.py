@@ -1,18 +1,67 @@
 """Image processing utilities for bingo card generation."""
 
 import base64
+import hashlib
+import json
+from collections.abc import Collection
 from io import BytesIO
 from pathlib import Path
 from typing import Literal
 
 from loguru import logger
-from PIL import Image
+from PIL import Image, ImageSequence, features
 from rich.console import Console
 
+logger.disable(__name__)  # Enabled by the CLIs
+
 console = Console()
 
 ImageType = Literal["background", "h_bingo", "celebration"]
 
+# (image key, config key, image type) for every image embedded in a bingo card
+IMAGE_CONFIGS: list[tuple[str, str, ImageType]] = [
+    ("background", "image_path", "background"),
+    ("h_bingo", "h_bingo_image_path", "h_bingo"),
+    ("bingo", "bingo_image_path", "celebration"),
+    ("double_bingo", "double_bingo_image_path", "celebration"),
+    ("super_bingo", "super_bingo_image_path", "celebration"),
+]
+
+# Maximum size of each image type after automatic scaling
+IMAGE_TARGET_SIZES_KB: dict[ImageType, float] = {
+    "background": 250.0,
+    "h_bingo": 50.0,
+    "celebration": 50.0,
+}
+
+# Image types that keep their animation when the source is an animated GIF/APNG/WebP
+ANIMATED_IMAGE_TYPES: tuple[ImageType, ...] = ("h_bingo", "celebration")
+
+# Celebration images are displayed at most ~400px wide, so animation frames are reduced to
+# this size right after decoding and every size search step works on the small frames
+ANIMATION_MAX_DIMENSION = 512
+
+# Reduction levels tried in order until an animation fits its size budget:
+# (keep every Nth frame, WebP quality) and (keep every Nth frame, APNG palette colors)
+WEBP_ANIMATION_LEVELS = [(1, 80), (1, 60), (2, 60), (2, 40), (3, 30), (4, 20)]
+APNG_ANIMATION_LEVELS = [(1, 256), (1, 128), (2, 64), (3, 32), (4, 16)]
+
+# Source images with more pixels, counting every frame of an animation, are rejected before
+# decoding (about 200MB as RGBA)
+MAX_SOURCE_PIXELS = 50_000_000
+
+# Still images are decoded at no more than this width/height unless downscaling is disabled.
+# Twice the largest display size keeps backgrounds sharp on high-DPI screens
+SOURCE_MAX_DIMENSION = 1600
+
+# Largest size the card displays the background at (.bingo-container max-width in bingo.jinja)
+BACKGROUND_DISPLAY_PX = 800
+
+ASSET_MANIFEST_NAME = "assets_manifest.json"
+# Bump whenever a change to image processing changes the variants, so older prepared
+# assets are reprocessed instead of reused
+ASSET_MANIFEST_VERSION = 3
+
 
 def get_image_size_kb(img: Image.Image, format: str = "PNG") -> float:
     """Get the size of an image in kilobytes.
@@ -91,6 +140,48 @@ def scale_image_to_target_size(
     return best_img
 
 
+def load_image_bounded(image_path: Path, max_dimension: int | None = SOURCE_MAX_DIMENSION) -> Image.Image:
+    """Open an image and decode it at close to its working resolution.
+
+    The pixel count of all frames is checked before any pixels are decoded. JPEGs are
+    decoded directly at 1/2, 1/4 or 1/8 scale where that still covers max_dimension
+    (draft mode), and other formats are reduced right after decoding, so peak memory
+    stays bounded by the source limits rather than the camera resolution.
+
+    Args:
+        image_path: Path to the image file.
+        max_dimension: Maximum width/height of the returned still image, or None to
+            decode at the original resolution. Animated images are never reduced here.
+
+    Returns:
+        PIL Image object (lazily loaded if it was not reduced).
+
+    Raises:
+        ValueError: If the image has more than MAX_SOURCE_PIXELS pixels in all its frames.
+    """
+    img = Image.open(image_path)
+    width, height = img.size
+    n_frames = getattr(img, "n_frames", 1)
+    if width * height * n_frames > MAX_SOURCE_PIXELS:
+        img.close()
+        frames = f" x {n_frames} frames" if n_frames > 1 else ""
+        logger.error(f"Image too large: {image_path} ({width}x{height}{frames})")
+        raise ValueError(
+            f"Image too large: {image_path} is {width}x{height} pixels{frames} "
+            f"(at most {MAX_SOURCE_PIXELS // 1_000_000} megapixels are supported)"
+        )
+
+    if max_dimension is None or max(width, height) <= max_dimension or is_animated(img):
+        return img
+
+    # Size that fits max_dimension with the source's aspect ratio
+    ratio = max_dimension / max(width, height)
+    fitted_size = (max(1, round(width * ratio)), max(1, round(height * ratio)))
+    img.draft(None, fitted_size)
+    img.thumbnail(fitted_size, Image.LANCZOS)
+    return img
+
+
 def create_square_image(img: Image.Image) -> Image.Image:
     """Create a square image by padding with transparency.
 
@@ -118,44 +209,285 @@ def create_square_image(img: Image.Image) -> Image.Image:
     return square_img
 
 
-def process_image(
+def is_animated(img: Image.Image) -> bool:
+    """Check whether an image has more than one frame.
+
+    Args:
+        img: PIL Image object to check.
+
+    Returns:
+        True if the image is animated.
+    """
+    return getattr(img, "is_animated", False) and getattr(img, "n_frames", 1) > 1
+
+
+def get_image_mime_type(img_bytes: bytes) -> str:
+    """Get the MIME type of encoded image bytes from their signature.
+
+    Args:
+        img_bytes: Encoded image bytes (at least the first 12 bytes).
+
+    Returns:
+        MIME type string, defaulting to image/png.
+    """
+    if img_bytes[:4] == b"RIFF" and img_bytes[8:12] == b"WEBP":
+        return "image/webp"
+    if img_bytes[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if img_bytes[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    return "image/png"
+
+
+def get_base64_mime_type(base64_encoded: str) -> str:
+    """Get the MIME type of a base64-encoded image for its data URI.
+
+    Args:
+        base64_encoded: Base64-encoded image string.
+
+    Returns:
+        MIME type string, defaulting to image/png.
+    """
+    return get_image_mime_type(base64.b64decode(base64_encoded[:16]))
+
+
+def get_image_extension(img_bytes: bytes) -> str:
+    """Get the file extension matching encoded image bytes.
+
+    Args:
+        img_bytes: Encoded image bytes.
+
+    Returns:
+        File extension including the leading dot (e.g. '.png').
+    """
+    return "." + get_image_mime_type(img_bytes).split("/")[1].replace("jpeg", "jpg")
+
+
+def load_animation_frames(
+    img: Image.Image, max_dimension: int | None = ANIMATION_MAX_DIMENSION
+) -> tuple[list[Image.Image], list[int]]:
+    """Decode every frame of an animation once, reduced to the working size and squared.
+
+    Each frame is reduced as soon as it is decoded, so only one frame is held at the
+    source resolution at a time.
+
+    Args:
+        img: Animated PIL Image object.
+        max_dimension: Maximum width/height of the returned frames, or None to keep the
+            original resolution.
+
+    Returns:
+        Tuple of the square RGBA frames and their durations in milliseconds.
+    """
+    frames = []
+    durations = []
+    for frame in ImageSequence.Iterator(img):
+        durations.append(int(frame.info.get("duration", 100)) or 100)
+        rgba_frame = frame.convert("RGBA")
+        if max_dimension is not None:
+            rgba_frame.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        frames.append(create_square_image(rgba_frame))
+    return frames, durations
+
+
+def reduce_animation_frames(
+    frames: list[Image.Image], durations: list[int], stride: int
+) -> tuple[list[Image.Image], list[int]]:
+    """Keep every Nth frame, extending the kept frames so the animation timing is unchanged.
+
+    Args:
+        frames: Animation frames.
+        durations: Frame durations in milliseconds.
+        stride: Keep every stride-th frame.
+
+    Returns:
+        Tuple of the kept frames and their durations.
+    """
+    if stride <= 1:
+        return frames, durations
+    kept_frames = frames[::stride]
+    kept_durations = [sum(durations[i:i + stride]) for i in range(0, len(durations), stride)]
+    return kept_frames, kept_durations
+
+
+def resize_animation_frames(frames: list[Image.Image], scale: float) -> list[Image.Image]:
+    """Resize all animation frames by the same factor.
+
+    Args:
+        frames: Animation frames.
+        scale: Scale factor.
+
+    Returns:
+        Resized frames.
+    """
+    if scale >= 1.0:
+        return frames
+    new_size = max(1, int(frames[0].width * scale))
+    return [frame.resize((new_size, new_size), Image.LANCZOS) for frame in frames]
+
+
+def encode_animation(
+    frames: list[Image.Image], durations: list[int], format: str, quality: int, fast: bool = False
+) -> bytes:
+    """Encode frames as an animated WebP or APNG.
+
+    Args:
+        frames: Animation frames.
+        durations: Frame durations in milliseconds.
+        format: 'WEBP' or 'PNG' (APNG).
+        quality: WebP quality (0-100), or number of palette colors for APNG.
+        fast: If True, use the fastest encoder settings (used while searching for a size).
+
+    Returns:
+        Encoded animation bytes.
+    """
+    buffer = BytesIO()
+    if format == "WEBP":
+        frames[0].save(
+            buffer, format="WEBP", save_all=True, append_images=frames[1:],
+            duration=durations, loop=0, quality=quality, method=0 if fast else 4,
+        )
+    else:
+        # Fewer colors per frame compress much better in the PNG deflate stream
+        if quality < 256:
+            frames = [
+                frame.quantize(quality, method=Image.Quantize.FASTOCTREE).convert("RGBA")
+                for frame in frames
+            ]
+        frames[0].save(
+            buffer, format="PNG", save_all=True, append_images=frames[1:],
+            duration=durations, loop=0, compress_level=1 if fast else 9,
+        )
+    return buffer.getvalue()
+
+
+def scale_animation_to_target_size(
+    frames: list[Image.Image], durations: list[int], target_size_kb: float, format: str
+) -> bytes:
+    """Encode an animation within a target file size in KB.
+
+    Lowers the quality (or palette size) and frame rate first, then the resolution, and
+    finally binary searches the scale factor with the most aggressive reduction level.
+    All steps resize from the already decoded working frames and use the fast encoder
+    settings; only the chosen parameters are encoded with the full settings.
+
+    Args:
+        frames: Square animation frames at the working resolution.
+        durations: Frame durations in milliseconds.
+        target_size_kb: Target maximum size in kilobytes.
+        format: 'WEBP' or 'PNG' (APNG).
+
+    Returns:
+        Encoded animation bytes.
+    """
+    levels = WEBP_ANIMATION_LEVELS if format == "WEBP" else APNG_ANIMATION_LEVELS
+
+    def encode(scale: float, stride: int, quality: int, fast: bool = True) -> bytes:
+        reduced_frames, reduced_durations = reduce_animation_frames(frames, durations, stride)
+        return encode_animation(
+            resize_animation_frames(reduced_frames, scale), reduced_durations, format, quality, fast
+        )
+
+    best_params = None
+    first_size_kb = len(encode(1.0, *levels[0])) / 1024
+    if first_size_kb <= target_size_kb:
+        best_params = (1.0, *levels[0])
+
+    # The reduction levels only gain a few x; far larger animations go straight to scaling
+    if best_params is None and first_size_kb <= 4 * target_size_kb:
+        for scale in (1.0, 0.75):
+            for stride, quality in levels:
+                if len(encode(scale, stride, quality)) / 1024 <= target_size_kb:
+                    best_params = (scale, stride, quality)
+                    break
+            if best_params is not None:
+                break
+
+    # Binary search the scale factor with the most aggressive reduction level
+    if best_params is None:
+        stride, quality = levels[-1]
+        min_scale = 0.1
+        max_scale = 0.75
+        for _ in range(8):
+            scale = (min_scale + max_scale) / 2
+            if len(encode(scale, stride, quality)) / 1024 <= target_size_kb:
+                best_params = (scale, stride, quality)
+                min_scale = scale
+            else:
+                max_scale = scale
+
+        # If we couldn't find a suitable size, use the smallest one
+        if best_params is None:
+            best_params = (min_scale, stride, quality)
+
+    return encode(*best_params, fast=False)
+
+
+def process_animated_image(
+    img: Image.Image, target_size_kb: float, no_downscaling: bool = False
+) -> bytes:
+    """Process an animated image into an animated WebP (or APNG if WebP is unavailable).
+
+    Args:
+        img: Animated PIL Image object.
+        target_size_kb: Target maximum size in KB.
+        no_downscaling: If True, keep every frame at the original resolution.
+
+    Returns:
+        Encoded animation bytes.
+    """
+    format = "WEBP" if features.check("webp") else "PNG"
+    if no_downscaling:
+        frames, durations = load_animation_frames(img, max_dimension=None)
+        return encode_animation(frames, durations, format, 90 if format == "WEBP" else 256)
+
+    frames, durations = load_animation_frames(img)
+    return scale_animation_to_target_size(frames, durations, target_size_kb, format)
+
+
+def process_image_bytes(
     image_path: Path,
     image_type: ImageType = "background",
-    target_size_kb: float = 250.0,
+    target_size_kb: float | None = None,
     no_downscaling: bool = False,
-) -> str:
-    """Process an image and return its base64 encoding.
+) -> bytes:
+    """Process an image and return the encoded image bytes.
 
     This function:
-    1. Loads the image
+    1. Loads the image, reduced to its working resolution while decoding (see
+       load_image_bounded)
     2. Converts it to a square aspect ratio
     3. Optionally scales it down to meet size requirements
-    4. Encodes it as base64 for embedding in HTML
+
+    Animated celebration images keep their animation and are encoded as animated WebP
+    (see process_animated_image); everything else is encoded as PNG.
 
     Args:
         image_path: Path to the image file.
         image_type: Type of image - determines size limits.
-        target_size_kb: Target maximum size in KB (for background images).
+        target_size_kb: Target maximum size in KB. Defaults to the image type's size in
+            IMAGE_TARGET_SIZES_KB.
         no_downscaling: If True, disable automatic scaling.
 
     Returns:
-        Base64-encoded image string ready for embedding in HTML.
+        Encoded image bytes.
 
     Raises:
         FileNotFoundError: If the image file does not exist.
+        ValueError: If the image has too many pixels.
     """
     if not image_path.exists():
         logger.error(f"Image file not found: {image_path}")
         raise FileNotFoundError(f"Image file not found: {image_path}")
 
     # Set appropriate target size based on image type
-    if image_type in ("h_bingo", "celebration"):
-        actual_target_size_kb = 50.0
-    else:
-        actual_target_size_kb = target_size_kb
+    actual_target_size_kb = target_size_kb if target_size_kb is not None else IMAGE_TARGET_SIZES_KB[image_type]
 
     # Load and make square
-    img = Image.open(image_path)
+    img = load_image_bounded(image_path, max_dimension=None if no_downscaling else SOURCE_MAX_DIMENSION)
+    if image_type in ANIMATED_IMAGE_TYPES and is_animated(img):
+        return process_animated_image(img, actual_target_size_kb, no_downscaling)
+
     square_img = create_square_image(img)
 
     # Apply automatic scaling if needed and not disabled
@@ -164,49 +496,194 @@ def process_image(
         if current_size_kb > actual_target_size_kb:
             square_img = scale_image_to_target_size(square_img, actual_target_size_kb)
 
-    # Encode to base64
     buffer = BytesIO()
     square_img.save(buffer, format="PNG")
-    buffer.seek(0)
-    img_bytes = buffer.read()
+    return buffer.getvalue()
 
-    base64_encoded = base64.b64encode(img_bytes).decode("ascii")
 
-    return base64_encoded
+# (source SHA-256, image type, target size, no_downscaling) -> base64-encoded processed image
+_processed_images: dict[tuple[str, ImageType, float | None, bool], str] = {}
 
 
-def process_all_images(config: dict, progress_task=None, progress_tracker=None) -> dict[str, str]:
+def process_image(
+    image_path: Path,
+    image_type: ImageType = "background",
+    target_size_kb: float | None = None,
+    no_downscaling: bool = False,
+) -> str:
+    """Process an image and return its base64 encoding.
+
+    See process_image_bytes for the processing steps.
+
+    Args:
+        image_path: Path to the image file.
+        image_type: Type of image - determines size limits.
+        target_size_kb: Target maximum size in KB. Defaults to the image type's size in
+            IMAGE_TARGET_SIZES_KB.
+        no_downscaling: If True, disable automatic scaling.
+
+    Returns:
+        Base64-encoded image string ready for embedding in HTML.
+
+    Raises:
+        FileNotFoundError: If the image file does not exist.
+        ValueError: If the image has too many pixels.
+    """
+    if not image_path.exists():
+        logger.error(f"Image file not found: {image_path}")
+        raise FileNotFoundError(f"Image file not found: {image_path}")
+
+    # Watch mode and --fit-budget process the same image at the same target repeatedly
+    key = (get_file_sha256(image_path), image_type, target_size_kb, no_downscaling)
+    encoding = _processed_images.get(key)
+    if encoding is None:
+        img_bytes = process_image_bytes(image_path, image_type, target_size_kb, no_downscaling)
+        encoding = base64.b64encode(img_bytes).decode("ascii")
+        _processed_images[key] = encoding
+    return encoding
+
+
+# (background SHA-256, grid size) -> base64-encoded tiles of the sliced background
+_background_tiles: dict[tuple[str, int], list[str]] = {}
+
+
+def slice_background_tiles(image_encoding: str, grid_size: int) -> list[str]:
+    """Slice a square background image into one piece per grid tile.
+
+    The background is resized to its display resolution (never enlarged), so each tile
+    only decodes and paints its own cell-sized piece when it is revealed. Slices are
+    cached per (image, grid size).
+
+    Args:
+        image_encoding: Base64-encoded square background image.
+        grid_size: Number of rows and columns in the bingo grid.
+
+    Returns:
+        Base64-encoded PNG tiles in row-major order.
+    """
+    key = (hashlib.sha256(image_encoding.encode("ascii")).hexdigest(), grid_size)
+    cached = _background_tiles.get(key)
+    if cached is not None:
+        return cached
+
+    with Image.open(BytesIO(base64.b64decode(image_encoding))) as img:
+        background = img.convert("RGBA")
+    # Round the cell size up so every tile has whole pixels; CSS scales it to the cell
+    cell_px = max(1, -(-min(BACKGROUND_DISPLAY_PX, background.width) // grid_size))
+    background = background.resize((cell_px * grid_size, cell_px * grid_size), Image.LANCZOS)
+
+    tiles = []
+    for row in range(grid_size):
+        for col in range(grid_size):
+            tile = background.crop((col * cell_px, row * cell_px, (col + 1) * cell_px, (row + 1) * cell_px))
+            buffer = BytesIO()
+            tile.save(buffer, format="PNG", optimize=True)
+            tiles.append(base64.b64encode(buffer.getvalue()).decode("ascii"))
+    _background_tiles[key] = tiles
+    return tiles
+
+
+def get_file_sha256(file_path: Path) -> str:
+    """Get the SHA-256 hash of a file's contents.
+
+    Args:
+        file_path: Path of the file to hash.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def load_prepared_images(
+    manifest_path: Path, no_downscaling: bool = False
+) -> dict[tuple[str, ImageType], Path]:
+    """Load the manifest written by the prepare-assets command.
+
+    Args:
+        manifest_path: Path to the assets manifest, or the directory containing it.
+        no_downscaling: Scaling mode of the current run. Variants prepared with a different
+            mode are ignored.
+
+    Returns:
+        Dictionary mapping (source image SHA-256, image type) to the prepared variant file.
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist.
+    """
+    if manifest_path.is_dir():
+        manifest_path = manifest_path / ASSET_MANIFEST_NAME
+    if not manifest_path.exists():
+        logger.error(f"Assets manifest not found: {manifest_path}")
+        raise FileNotFoundError(f"Assets manifest not found: {manifest_path}")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if (
+        manifest.get("version") != ASSET_MANIFEST_VERSION
+        or manifest.get("no_downscaling", False) != no_downscaling
+    ):
+        return {}
+
+    prepared = {}
+    for entry in manifest["images"].values():
+        for img_type, variant in entry["variants"].items():
+            prepared[(entry["sha256"], img_type)] = manifest_path.parent / variant["file"]
+    return prepared
+
+
+def process_all_images(
+    config: dict,
+    progress_task=None,
+    progress_tracker=None,
+    target_sizes_kb: dict[ImageType, float] | None = None,
+    keys: Collection[str] | None = None,
+) -> dict[str, str]:
     """Process all images for a bingo card.
 
+    If the configuration names an assets manifest (see prepare_assets.py), images that were
+    prepared ahead of time are read from their variant files instead of being processed.
+
     Args:
         config: Configuration dictionary with image paths.
         progress_task: Optional progress task ID for updating descriptions.
         progress_tracker: Optional Rich Progress instance.
+        target_sizes_kb: Optional target size in KB of each image type, overriding
+            IMAGE_TARGET_SIZES_KB. Prepared variants are only used for the default sizes.
+        keys: Optional image keys (the first item of each IMAGE_CONFIGS entry) to process,
+            e.g. only the images that changed. Defaults to all images.
 
     Returns:
         Dictionary mapping image types to their base64 encodings.
     """
-    image_configs = [
-        ("background", config["image_path"], "background"),
-        ("h_bingo", config["h_bingo_image_path"], "h_bingo"),
-        ("bingo", config["bingo_image_path"], "celebration"),
-        ("double_bingo", config["double_bingo_image_path"], "celebration"),
-        ("super_bingo", config["super_bingo_image_path"], "celebration"),
-    ]
+    no_downscaling = config.get("no_downscaling", False)
+    prepared = {}
+    if config.get("assets_manifest"):
+        prepared = load_prepared_images(Path(config["assets_manifest"]).expanduser(), no_downscaling)
 
     images = {}
-    for idx, (key, path, img_type) in enumerate(image_configs, 1):
+    for idx, (key, config_key, img_type) in enumerate(IMAGE_CONFIGS, 1):
+        if keys is not None and key not in keys:
+            continue
         # Update progress description if available
         if progress_tracker and progress_task is not None:
             progress_tracker.update(
                 progress_task,
-                description=f"Processing images ({idx}/{len(image_configs)})"
+                description=f"Processing images ({idx}/{len(IMAGE_CONFIGS)})"
             )
 
+        image_path = Path(config[config_key])
+        target_size_kb = target_sizes_kb.get(img_type) if target_sizes_kb else None
+        use_prepared = prepared and target_size_kb in (None, IMAGE_TARGET_SIZES_KB[img_type])
+        variant = prepared.get((get_file_sha256(image_path), img_type)) if use_prepared else None
+        if variant is not None and variant.exists():
+            images[key] = base64.b64encode(variant.read_bytes()).decode("ascii")
+            continue
+
         images[key] = process_image(
-            Path(path),
+            image_path,
             image_type=img_type,
-            no_downscaling=config.get("no_downscaling", False),
+            target_size_kb=target_size_kb,
+            no_downscaling=no_downscaling,
         )
 
     return images
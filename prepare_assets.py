@@ -0,0 +1,246 @@
+"""Precompute optimized image variants for bingo card generation.
+
+Every image in a directory is squared and size-capped once for each image type, in
+parallel across files, and an assets manifest is written that process_all_images can use
+directly, so card generation does no image work at all.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+import click
+from loguru import logger
+from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from rich.table import Table
+
+from image_processor import (
+    ANIMATED_IMAGE_TYPES,
+    ASSET_MANIFEST_NAME,
+    ASSET_MANIFEST_VERSION,
+    IMAGE_TARGET_SIZES_KB,
+    get_file_sha256,
+    get_image_extension,
+    process_image_bytes,
+)
+
+console = Console()
+logger.enable("image_processor")
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
+# Suffixes of the encoded variants (see get_image_extension)
+VARIANT_SUFFIXES = {".png", ".jpg", ".gif", ".webp"}
+
+
+def prepare_image(source: Path, output_dir: Path, no_downscaling: bool = False) -> dict[str, Any]:
+    """Write the variant of one source image for every image type.
+
+    Args:
+        source: Path to the source image.
+        output_dir: Directory the variants are written to.
+        no_downscaling: If True, disable automatic scaling.
+
+    Returns:
+        Manifest entry describing the source image and its variants.
+    """
+    entry: dict[str, Any] = {"sha256": get_file_sha256(source), "variants": {}}
+    # Image types processed the same way share one variant file
+    variant_by_processing: dict[tuple[float, bool], dict[str, Any]] = {}
+    for img_type, target_size_kb in IMAGE_TARGET_SIZES_KB.items():
+        processing = (target_size_kb, img_type in ANIMATED_IMAGE_TYPES)
+        if processing not in variant_by_processing:
+            img_bytes = process_image_bytes(
+                source, image_type=img_type, target_size_kb=target_size_kb, no_downscaling=no_downscaling
+            )
+            variant_file = f"{source.name}.{img_type}{get_image_extension(img_bytes)}"
+            (output_dir / variant_file).write_bytes(img_bytes)
+            variant_by_processing[processing] = {"file": variant_file, "size_kb": round(len(img_bytes) / 1024, 1)}
+        entry["variants"][img_type] = dict(variant_by_processing[processing])
+    return entry
+
+
+def load_existing_entries(manifest_path: Path, no_downscaling: bool) -> dict[str, dict[str, Any]]:
+    """Load the entries of a previous run that can be reused.
+
+    Args:
+        manifest_path: Path to the assets manifest.
+        no_downscaling: Scaling mode of the current run.
+
+    Returns:
+        Dictionary mapping source file names to their manifest entries.
+    """
+    if not manifest_path.exists():
+        return {}
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if (
+        manifest.get("version") != ASSET_MANIFEST_VERSION
+        or manifest.get("no_downscaling", False) != no_downscaling
+    ):
+        return {}
+    return manifest["images"]
+
+
+def remove_stale_variants(output_dir: Path, manifest: dict[str, Any]) -> list[Path]:
+    """Delete variant files of earlier runs that no manifest entry refers to anymore.
+
+    Only files named like variants ('<source>.<image type><ext>') are considered, so other
+    files in the output directory are left alone.
+
+    Args:
+        output_dir: Directory the variants are written to.
+        manifest: The assets manifest just written.
+
+    Returns:
+        Paths of the deleted files.
+    """
+    referenced = {
+        variant["file"] for entry in manifest["images"].values() for variant in entry["variants"].values()
+    }
+    removed = []
+    for path in sorted(output_dir.iterdir()):
+        stem, _, img_type = path.stem.rpartition(".")
+        if (
+            path.is_file()
+            and stem
+            and img_type in IMAGE_TARGET_SIZES_KB
+            and path.suffix in VARIANT_SUFFIXES
+            and path.name not in referenced
+        ):
+            path.unlink()
+            removed.append(path)
+    return removed
+
+
+def prepare_assets(
+        image_dir: Path,
+        output_dir: Path,
+        no_downscaling: bool = False,
+        workers: int | None = None,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Prepare variants for every image in a directory and write the assets manifest.
+
+    Images whose contents and variants are unchanged since the previous run are skipped.
+    An image that cannot be processed is left out of the manifest instead of stopping the
+    run, and variants no entry refers to anymore are deleted.
+
+    Args:
+        image_dir: Directory containing the source images.
+        output_dir: Directory the variants and manifest are written to.
+        no_downscaling: If True, disable automatic scaling.
+        workers: Number of worker processes (default: number of CPUs).
+
+    Returns:
+        Tuple of the written assets manifest and the error of each image that failed, by
+        source file name.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / ASSET_MANIFEST_NAME
+    existing = load_existing_entries(manifest_path, no_downscaling)
+
+    sources = sorted(
+        path for path in image_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+    )
+
+    images = {}
+    failures: dict[str, str] = {}
+    to_process = []
+    for source in sources:
+        entry = existing.get(source.name)
+        if (
+            entry is not None
+            and entry["sha256"] == get_file_sha256(source)
+            and all((output_dir / v["file"]).exists() for v in entry["variants"].values())
+        ):
+            images[source.name] = entry
+        else:
+            to_process.append(source)
+
+    with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console
+    ) as progress:
+        task = progress.add_task("Preparing image variants", total=len(to_process))
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(prepare_image, source, output_dir, no_downscaling): source
+                for source in to_process
+            }
+            for future in as_completed(futures):
+                try:
+                    images[futures[future].name] = future.result()
+                except Exception as e:
+                    failures[futures[future].name] = str(e)
+                progress.advance(task)
+
+    manifest = {
+        "version": ASSET_MANIFEST_VERSION,
+        "no_downscaling": no_downscaling,
+        "images": dict(sorted(images.items())),
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    remove_stale_variants(output_dir, manifest)
+    return manifest, dict(sorted(failures.items()))
+
+
+@click.command()
+@click.argument("image_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to write the variants and manifest to (default: IMAGE_DIR/prepared)",
+    default=None,
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (default: number of CPUs)",
+    default=None,
+)
+@click.option(
+    "--no-down-scaling",
+    is_flag=True,
+    help="Disable automatic image scaling (must match the setting used when generating cards)",
+    default=False,
+)
+def main(image_dir: Path, output_dir: Path | None, workers: int | None, no_down_scaling: bool):
+    """Precompute squared, size-capped variants of every image in IMAGE_DIR.
+
+    Pass the output directory (or its manifest) to create-bingo-card with --assets-manifest
+    to skip image processing during card generation.
+
+    Args:
+        image_dir: Directory containing the source images.
+        output_dir: Directory to write the variants and manifest to.
+        workers: Number of worker processes.
+        no_down_scaling: Whether to disable automatic image scaling.
+    """
+    image_dir = image_dir.expanduser().resolve()
+    output_dir = (output_dir or image_dir / "prepared").expanduser().resolve()
+
+    manifest, failures = prepare_assets(image_dir, output_dir, no_downscaling=no_down_scaling, workers=workers)
+
+    table = Table(title="Prepared Image Variants")
+    table.add_column("Image", style="cyan")
+    for img_type in IMAGE_TARGET_SIZES_KB:
+        table.add_column(img_type, style="magenta")
+    for name, entry in manifest["images"].items():
+        table.add_row(name, *(f"{v['size_kb']:.1f} KB" for v in entry["variants"].values()))
+
+    console.print(table)
+    console.print(f"\n[bold green]✅ Wrote[/] [cyan]{output_dir / ASSET_MANIFEST_NAME}[/]")
+    if failures:
+        console.print(f"\n[bold red]❌ {len(failures)} image(s) could not be prepared:[/]")
+        for name, error in failures.items():
+            console.print(f"  [cyan]{name}[/]: {error}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Printable bingo card sheets.
+
+Cards are drawn with Pillow from their grids (no browser involved) and imposed several
+to a page. Pages are rendered in parallel worker processes and written as they complete,
+either streamed into one multi-page PDF or as numbered PNG files, so only a bounded window
+of pages is ever held in memory regardless of the number of cards.
+"""
+
+import itertools
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, ImageDraw
+
+from themes import Theme
+from tile_layout import (
+    REFERENCE_CELL_PX,
+    REFERENCE_FONT_PX,
+    TILE_FONT_SCALES,
+    layout_tile_text,
+    load_font,
+)
+
+# Page sizes in inches (portrait)
+PAGE_SIZES = {
+    "letter": (8.5, 11.0),
+    "a4": (8.27, 11.69),
+}
+
+# Cards per page -> (columns, rows)
+PAGE_LAYOUTS = {
+    1: (1, 1),
+    2: (1, 2),
+    4: (2, 2),
+    6: (2, 3),
+    9: (3, 3),
+}
+
+DEFAULT_DPI = 150
+PAGE_MARGIN_IN = 0.4
+CARD_GUTTER_IN = 0.3
+BACKGROUND_OPACITY = 0.15  # Background image is printed faintly behind the tiles
+PDF_JPEG_QUALITY = 90
+
+# (card ID, grid) for one card
+PrintCard = tuple[str, list[list[str]]]
+
+# Set in each worker process by _init_worker, so shared data is sent once per process
+_worker_settings: dict[str, Any] = {}
+
+
+def _init_worker(settings: dict[str, Any]) -> None:
+    _worker_settings.clear()
+    _worker_settings.update(settings)
+    _worker_settings["faded_backgrounds"] = {}
+    if settings["background"] is not None:
+        with Image.open(BytesIO(settings["background"])) as background:
+            # Transparent padding prints as paper, not black
+            background = background.convert("RGBA")
+            _worker_settings["background_image"] = Image.alpha_composite(
+                Image.new("RGBA", background.size, "white"), background
+            ).convert("RGB")
+
+
+def _get_faded_background(size: int) -> Image.Image | None:
+    """Get the background image scaled to a grid and faded for printing (cached per size)."""
+    background = _worker_settings.get("background_image")
+    if background is None:
+        return None
+    faded = _worker_settings["faded_backgrounds"].get(size)
+    if faded is None:
+        faded = Image.blend(
+            Image.new("RGB", (size, size), "white"),
+            background.resize((size, size), Image.Resampling.LANCZOS),
+            BACKGROUND_OPACITY,
+        )
+        _worker_settings["faded_backgrounds"][size] = faded
+    return faded
+
+
+def _draw_card(page: Image.Image, card: PrintCard, box: tuple[int, int, int, int]) -> None:
+    """Draw one card into a box of the page."""
+    settings = _worker_settings
+    card_id, grid = card
+    left, top, right, bottom = box
+    draw = ImageDraw.Draw(page)
+    font_path = settings["font_path"]
+    colors = settings["colors"]
+
+    # Title above the grid and the card ID below it
+    title_px = round((bottom - top) * 0.08)
+    footer_px = round((bottom - top) * 0.03)
+    grid_px = min(right - left, bottom - top - title_px - 2 * footer_px)
+    tile_size = len(grid)
+    cell_px = grid_px // tile_size
+    grid_px = cell_px * tile_size
+    grid_left = left + (right - left - grid_px) // 2
+    grid_top = top + title_px
+
+    draw.text(
+        ((left + right) // 2, top + title_px // 2),
+        settings["title"],
+        fill=colors["title"],
+        font=load_font(font_path, round(title_px * 0.8)),
+        anchor="mm",
+    )
+
+    faded = _get_faded_background(grid_px)
+    if faded is not None:
+        page.paste(faded, (grid_left, grid_top))
+
+    # Tile text uses the same line breaks and font scales as the HTML card
+    font_ratio = cell_px * REFERENCE_FONT_PX / REFERENCE_CELL_PX
+    for row_index, row in enumerate(grid):
+        for col_index, text in enumerate(row):
+            x = grid_left + col_index * cell_px
+            y = grid_top + row_index * cell_px
+            draw.rectangle((x, y, x + cell_px, y + cell_px), outline=colors["grid"], width=2)
+
+            lines, scale_class = layout_tile_text(text, font_path)
+            font_px = max(1, round(font_ratio * TILE_FONT_SCALES[int(scale_class.split("-")[1])]))
+            draw.multiline_text(
+                (x + cell_px / 2, y + cell_px / 2),
+                lines,
+                fill=colors["text"],
+                font=load_font(font_path, font_px),
+                anchor="mm",
+                align="center",
+                spacing=round(font_px * 0.1),
+            )
+
+    draw.text(
+        ((left + right) // 2, grid_top + grid_px + footer_px),
+        f"Card {card_id}",
+        fill=colors["grid"],
+        font=load_font(font_path, round(footer_px * 0.8)),
+        anchor="mm",
+    )
+
+
+def render_page(cards: list[PrintCard]) -> Image.Image:
+    """Render one page of cards (runs in a worker process).
+
+    Args:
+        cards: Cards to place on the page, at most the page's cards per page.
+
+    Returns:
+        RGB page image.
+    """
+    settings = _worker_settings
+    dpi = settings["dpi"]
+    width_in, height_in = PAGE_SIZES[settings["page_size"]]
+    page = Image.new("RGB", (round(width_in * dpi), round(height_in * dpi)), "white")
+
+    columns, rows = PAGE_LAYOUTS[settings["cards_per_page"]]
+    margin = PAGE_MARGIN_IN * dpi
+    gutter = CARD_GUTTER_IN * dpi
+    card_width = (page.width - 2 * margin - (columns - 1) * gutter) / columns
+    card_height = (page.height - 2 * margin - (rows - 1) * gutter) / rows
+
+    for index, card in enumerate(cards):
+        column, row = index % columns, index // columns
+        left = margin + column * (card_width + gutter)
+        top = margin + row * (card_height + gutter)
+        box = (round(left), round(top), round(left + card_width), round(top + card_height))
+        _draw_card(page, card, box)
+    return page
+
+
+def _paginate(cards: Iterable[PrintCard], cards_per_page: int) -> Iterator[list[PrintCard]]:
+    iterator = iter(cards)
+    while page := list(itertools.islice(iterator, cards_per_page)):
+        yield page
+
+
+class _PdfPageSink:
+    """Append pages to a PDF in batches, so the document is never held in memory."""
+
+    def __init__(self, path: Path, dpi: int, batch_size: int) -> None:
+        self.path = path
+        self.dpi = dpi
+        self.batch_size = batch_size
+        self.batch: list[Image.Image] = []
+        self.started = False
+
+    def add(self, page: Image.Image) -> None:
+        self.batch.append(page)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.batch:
+            return
+        first, *rest = self.batch
+        first.save(
+            self.path,
+            format="PDF",
+            save_all=True,
+            append_images=rest,
+            append=self.started,
+            resolution=self.dpi,
+            quality=PDF_JPEG_QUALITY,
+        )
+        self.started = True
+        self.batch = []
+
+
+def export_print_sheets(
+        cards: Iterable[PrintCard],
+        output_path: Path,
+        theme_config: Theme | None = None,
+        background: bytes | None = None,
+        font_path: Path | None = None,
+        cards_per_page: int = 4,
+        page_size: str = "letter",
+        dpi: int = DEFAULT_DPI,
+        workers: int | None = None,
+        on_page: Callable[[int], None] | None = None,
+) -> list[Path]:
+    """Render cards onto printable pages.
+
+    Args:
+        cards: Cards to print, as (card ID, grid) tuples. May be a generator, so cards are
+            created only as pages are rendered.
+        output_path: A .pdf file to write all pages to, or a .png path whose stem is used
+            for numbered page files (e.g. 'cards_p0001.png').
+        theme_config: Optional theme configuration dictionary (used for the title color).
+        background: Optional encoded background image, printed faintly behind the tiles.
+        font_path: Optional font file for the card text. If None, Pillow's default font
+            is used.
+        cards_per_page: Number of cards on each page (one of PAGE_LAYOUTS).
+        page_size: Page size name (one of PAGE_SIZES).
+        dpi: Print resolution in dots per inch.
+        workers: Number of worker processes (default: number of CPUs).
+        on_page: Optional callback receiving the number of cards on each written page.
+
+    Returns:
+        Paths of the written files.
+
+    Raises:
+        ValueError: If the page layout, page size or output format is not supported.
+    """
+    if cards_per_page not in PAGE_LAYOUTS:
+        raise ValueError(
+            f"Unsupported cards per page: {cards_per_page}. Use one of: {', '.join(map(str, PAGE_LAYOUTS))}"
+        )
+    if page_size not in PAGE_SIZES:
+        raise ValueError(f"Unsupported page size: {page_size}. Use one of: {', '.join(PAGE_SIZES)}")
+    suffix = output_path.suffix.lower()
+    if suffix not in (".pdf", ".png"):
+        raise ValueError(f"Unsupported print export format: {output_path.name}. Use a .pdf or .png path")
+
+    colors = theme_config["colors"] if theme_config else None
+    settings = {
+        "dpi": dpi,
+        "page_size": page_size,
+        "cards_per_page": cards_per_page,
+        "font_path": str(font_path) if font_path is not None else None,
+        "background": background,
+        "title": "BINGO",
+        "colors": {
+            "title": colors["primary"] if colors else "#7303c0",
+            "text": "#111111",
+            "grid": "#333333",
+        },
+    }
+
+    workers = workers or os.cpu_count() or 1
+    # Pages rendered ahead of the one being written; bounds memory use
+    window = 2 * workers
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    pdf_sink = _PdfPageSink(output_path, dpi, batch_size=window) if suffix == ".pdf" else None
+    written: list[Path] = []
+
+    def write_page(future: Future, page_cards: int) -> None:
+        page = future.result()
+        if pdf_sink is not None:
+            pdf_sink.add(page)
+        else:
+            page_file = output_path.with_name(f"{output_path.stem}_p{len(written) + 1:04d}.png")
+            page.save(page_file, dpi=(dpi, dpi))
+            written.append(page_file)
+        if on_page is not None:
+            on_page(page_cards)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as executor:
+        pending: deque[tuple[Future, int]] = deque()
+        for page_cards in _paginate(cards, cards_per_page):
+            pending.append((executor.submit(render_page, page_cards), len(page_cards)))
+            if len(pending) >= window:
+                write_page(*pending.popleft())
+        while pending:
+            write_page(*pending.popleft())
+
+    if pdf_sink is not None:
+        pdf_sink.flush()
+        if pdf_sink.started:
+            written.append(output_path)
+    return written
@@ -0,0 +1,363 @@
+"""Sharded, resumable generation of large card batches.
+
+With a master seed, the grid of every card follows from (master seed, tile size, card
+number) alone, so one logical batch can be split across machines: ``--shard 2/4``
+generates the second quarter of the card numbers and nothing else, and any shard can be
+regenerated identically. Each shard keeps a checkpoint, a JSON Lines file with a header
+describing the batch and one line per finished card, which lets an interrupted run skip
+the cards it already wrote. ``bingo-merge-shards`` combines the checkpoints of all shards,
+checks that they belong to the same batch, cover it exactly and share no card, and writes
+the grids in the format the bingo-caller console reads.
+"""
+
+import hashlib
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, NamedTuple, TextIO
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from bingo_generator import get_random_bingo_items
+from caller import GridRecorder
+
+console = Console()
+
+CHECKPOINT_VERSION = 1
+
+
+class Shard(NamedTuple):
+    """One of the equal slices a batch is split into (1-based, e.g. 2 of 4)."""
+    index: int
+    total: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.total}"
+
+    def card_numbers(self, count: int) -> range:
+        """Get the card numbers of this shard.
+
+        Args:
+            count: Number of cards of each tile size in the whole batch.
+
+        Returns:
+            Contiguous range of 1-based card numbers; shards differ in size by at most one.
+        """
+        return range(count * (self.index - 1) // self.total + 1, count * self.index // self.total + 1)
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard given as 'i/n'.
+
+    Args:
+        value: Shard index and number of shards, e.g. '2/4'.
+
+    Returns:
+        Parsed shard.
+
+    Raises:
+        ValueError: If the value is not of the form 'i/n' with 1 <= i <= n.
+    """
+    index, _, total = value.partition("/")
+    try:
+        shard = Shard(int(index), int(total))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {value}. Use the form i/n, e.g. 2/4") from None
+    if not 1 <= shard.index <= shard.total:
+        raise ValueError(f"Invalid shard: {value}. The shard index must be between 1 and {shard.total}")
+    return shard
+
+
+def card_seed(master_seed: int, tile_size: int, card_number: int) -> int:
+    """Derive the seed of one card from the batch's master seed.
+
+    Args:
+        master_seed: Seed of the whole batch.
+        tile_size: Number of rows and columns in the bingo grid.
+        card_number: 1-based number of the card within its tile size batch.
+
+    Returns:
+        64-bit seed, the same on every machine and Python process.
+    """
+    digest = hashlib.sha256(f"{master_seed}:{tile_size}:{card_number}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def get_seeded_grid(
+        items: list[str],
+        master_seed: int,
+        tile_size: int,
+        card_number: int,
+        free_center: bool = False,
+) -> list[list[str]]:
+    """Get the grid of one card of a seeded batch.
+
+    Args:
+        items: List of possible bingo tile values to choose from.
+        master_seed: Seed of the whole batch.
+        tile_size: Number of rows and columns in the bingo grid.
+        card_number: 1-based number of the card within its tile size batch.
+        free_center: If True, sets the center tile to 'FREE'.
+
+    Returns:
+        2D list containing the card's bingo grid.
+    """
+    # Sampling depends on the order of the pool, so any pool order gives the same grid
+    return get_random_bingo_items(
+        sorted(items),
+        free_center=free_center,
+        tile_size=tile_size,
+        rng=random.Random(card_seed(master_seed, tile_size, card_number)),
+    )
+
+
+def batch_header(master_seed: int, shard: Shard, count: int, input_keys: dict[int, str]) -> dict[str, Any]:
+    """Build the checkpoint header identifying a shard of a batch.
+
+    Args:
+        master_seed: Seed of the whole batch.
+        shard: Shard the checkpoint belongs to.
+        count: Number of cards of each tile size in the whole batch.
+        input_keys: Build manifest input hash of each tile size (see BuildManifest.input_key).
+
+    Returns:
+        Header dictionary.
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "master_seed": master_seed,
+        "shard": str(shard),
+        "count": count,
+        "input_keys": {str(size): key for size, key in input_keys.items()},
+    }
+
+
+@dataclass(frozen=True)
+class CheckpointCard:
+    """A card finished by a shard."""
+    tile_size: int
+    card_number: int
+    card_id: str
+    grid: list[list[str]]
+    file: str
+
+
+def read_checkpoint(path: Path) -> tuple[dict[str, Any], dict[tuple[int, int], CheckpointCard]]:
+    """Read a checkpoint file.
+
+    A line cut off by an interrupted run is ignored.
+
+    Args:
+        path: Path to the checkpoint file.
+
+    Returns:
+        Tuple of the header and the finished cards by (tile size, card number).
+
+    Raises:
+        ValueError: If the file is not a checkpoint.
+    """
+    lines = path.read_text(encoding="utf-8").split("\n")
+    try:
+        header = json.loads(lines[0])
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a bingo card checkpoint")
+
+    cards = {}
+    # The last element is empty, or the line an interrupted run was writing
+    for line in lines[1:-1]:
+        card = CheckpointCard(**json.loads(line))
+        cards[(card.tile_size, card.card_number)] = card
+    return header, cards
+
+
+class Checkpoint:
+    """Record the cards a shard has finished, resuming from the cards recorded earlier.
+
+    Checkpoints are context managers; the file is closed when the context exits.
+    """
+
+    def __init__(self, path: Path, header: dict[str, Any]) -> None:
+        """Open a checkpoint. A new checkpoint file is created when the first card is recorded.
+
+        Args:
+            path: Path to the checkpoint file.
+            header: Header of the shard (see batch_header).
+
+        Raises:
+            ValueError: If the file is a checkpoint of a different batch or shard.
+        """
+        self.path = path
+        self.header = header
+        self.cards: dict[tuple[int, int], CheckpointCard] = {}
+        self._file: TextIO | None = None
+        if path.exists():
+            existing_header, self.cards = read_checkpoint(path)
+            if existing_header != header:
+                raise ValueError(
+                    f"Checkpoint {path} was written for a different batch or shard "
+                    f"(shard {existing_header['shard']}, master seed {existing_header['master_seed']}). "
+                    f"Use another checkpoint path, or delete it to start over"
+                )
+            # Drop a line cut off by an interrupted run, so appended lines start on their own
+            content = path.read_bytes()
+            with path.open(mode="r+b") as f:
+                f.truncate(content.rindex(b"\n") + 1)
+
+    def finished(self, tile_size: int, card_number: int) -> CheckpointCard | None:
+        """Get a card finished by an earlier run, if its file still exists.
+
+        Args:
+            tile_size: Number of rows and columns in the bingo grid.
+            card_number: 1-based number of the card within its tile size batch.
+
+        Returns:
+            The recorded card, or None if it has to be generated.
+        """
+        card = self.cards.get((tile_size, card_number))
+        if card is None or not Path(card.file).exists():
+            return None
+        return card
+
+    def record(self, card: CheckpointCard) -> None:
+        """Record a finished card. Each line is flushed, so an interrupted run loses no card.
+
+        Args:
+            card: Card whose file has been written.
+        """
+        self.cards[(card.tile_size, card.card_number)] = card
+        if self._file is None:
+            # Created only once a card file exists, so a run that fails before writing any
+            # card leaves no checkpoint behind
+            if not self.path.exists():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(self.header, sort_keys=True) + "\n", encoding="utf-8")
+            self._file = self.path.open(mode="a", encoding="utf-8")
+        self._file.write(json.dumps(asdict(card), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def merge_checkpoints(paths: list[Path]) -> list[CheckpointCard]:
+    """Combine the checkpoints of all shards of a batch.
+
+    Args:
+        paths: Checkpoint files, one per shard, in any order.
+
+    Returns:
+        All cards of the batch, ordered by tile size and card number.
+
+    Raises:
+        ValueError: If the checkpoints belong to different batches, a shard is missing,
+            repeated or unfinished, or two cards have the same card ID.
+    """
+    checkpoints = [(path, *read_checkpoint(path)) for path in paths]
+    first_path, first_header, _ = checkpoints[0]
+    shard_total = parse_shard(first_header["shard"]).total
+    shards: dict[Shard, Path] = {}
+    for path, header, _ in checkpoints:
+        shard = parse_shard(header["shard"])
+        if shard.total != shard_total or any(
+                header[key] != first_header[key] for key in ("master_seed", "count", "input_keys")
+        ):
+            raise ValueError(f"{path} and {first_path} are checkpoints of different batches")
+        if shard in shards:
+            raise ValueError(f"{path} and {shards[shard]} are both checkpoints of shard {shard}")
+        shards[shard] = path
+
+    missing = [str(Shard(index, shard_total)) for index in range(1, shard_total + 1) if Shard(index, shard_total) not in shards]
+    if missing:
+        raise ValueError(f"Missing checkpoints of shard(s): {', '.join(missing)}")
+
+    merged: list[CheckpointCard] = []
+    tile_sizes = sorted(int(size) for size in first_header["input_keys"])
+    for path, header, cards in checkpoints:
+        shard = parse_shard(header["shard"])
+        unfinished = [
+            (size, number) for size in tile_sizes for number in shard.card_numbers(header["count"])
+            if (size, number) not in cards
+        ]
+        if unfinished:
+            raise ValueError(
+                f"Shard {shard} ({path}) is missing {len(unfinished)} card(s); resume it with the same options"
+            )
+        merged.extend(cards.values())
+
+    card_numbers: dict[str, CheckpointCard] = {}
+    for card in merged:
+        duplicate = card_numbers.setdefault(card.card_id, card)
+        if duplicate is not card:
+            raise ValueError(
+                f"Card {card.card_id} is both {duplicate.tile_size}x{duplicate.tile_size} card "
+                f"{duplicate.card_number} and {card.tile_size}x{card.tile_size} card {card.card_number}"
+            )
+    return sorted(merged, key=lambda card: (card.tile_size, card.card_number))
+
+
+@click.command()
+@click.argument(
+    "checkpoints",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the grids of all cards to this JSON Lines file, for the bingo-caller console",
+    default=None,
+)
+def main(checkpoints: tuple[Path, ...], output: Path | None):
+    """Check that the shards of a batch fit together and combine their cards.
+
+    CHECKPOINTS are the --checkpoint files of all shards.
+
+    Args:
+        checkpoints: Checkpoint files of the shards.
+        output: Optional JSON Lines path to write the grids of all cards to.
+    """
+    try:
+        cards = merge_checkpoints(list(checkpoints))
+    except Exception as e:
+        console.print(f"[bold red]❌ Error:[/] {e}")
+        raise
+
+    table = Table(title="Merged Shards")
+    table.add_column("Grid", style="cyan")
+    table.add_column("Cards", style="magenta", justify="right")
+    table.add_column("Card Numbers", justify="right")
+    for tile_size in sorted({card.tile_size for card in cards}):
+        numbers = [card.card_number for card in cards if card.tile_size == tile_size]
+        table.add_row(f"{tile_size}x{tile_size}", str(len(numbers)), f"{numbers[0]}-{numbers[-1]}")
+    console.print(table)
+    console.print(f"[bold green]✅ {len(checkpoints)} shard(s), {len(cards)} unique cards[/]")
+
+    if output is not None:
+        with GridRecorder(output) as recorder:
+            for card in cards:
+                recorder.record(card.card_id, card.grid)
+        console.print(f"[bold]Recorded[/] {recorder.count} card grids in [cyan]{output}[/]")
+
+
+if __name__ == "__main__":
+    main()
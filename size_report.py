@@ -0,0 +1,174 @@
+"""Size breakdown and budgets for generated bingo cards.
+
+A card's bytes are split into the template's static markup, the theme, the tile pool,
+the embedded fonts and each embedded image. Every part is measured by rendering the card
+again with that part blanked out, so the numbers are exact for any template (minified or
+not) and the template's share is whatever remains.
+"""
+
+import base64
+from dataclasses import dataclass
+from typing import Any
+
+from jinja2 import Template
+from rich.console import Console
+from rich.table import Table
+
+from image_processor import IMAGE_CONFIGS, IMAGE_TARGET_SIZES_KB, ImageType
+
+# Template data key of each embedded image -> (label, image type)
+IMAGE_PARTS: dict[str, tuple[str, ImageType]] = {
+    "image" if key == "background" else f"{key}_image": (f"{key.replace('_', ' ')} image", img_type)
+    for key, _, img_type in IMAGE_CONFIGS
+}
+
+# Template data keys holding the tile pool and the grid
+TILE_POOL_KEYS = ("all_bingo_items", "tile_layouts", "initial_items", "initial_layouts")
+
+# Headroom left when tightening image targets, as image sizes only roughly follow them
+FIT_MARGIN = 0.95
+
+
+@dataclass(frozen=True)
+class SizePart:
+    """Bytes of one part of a card."""
+    name: str
+    size: int  # Bytes in the HTML document
+    decoded_size: int | None = None  # Bytes before base64 encoding (embedded images)
+    image_type: ImageType | None = None
+
+
+@dataclass(frozen=True)
+class CardSizeReport:
+    """Size breakdown of a rendered card."""
+    total_size: int
+    parts: list[SizePart]
+
+    @property
+    def image_size(self) -> int:
+        """Bytes of the embedded images."""
+        return sum(part.size for part in self.parts if part.image_type is not None)
+
+
+def _blank(value: Any) -> Any:
+    """Replace every string in a value with an empty one, keeping its structure."""
+    if isinstance(value, str):
+        return ""
+    if isinstance(value, dict):
+        return {key: _blank(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_blank(item) for item in value)
+    return value
+
+
+def _rendered_size(template: Template, template_data: dict[str, Any]) -> int:
+    return len(template.render(template_data).encode("utf-8"))
+
+
+def analyze_card(template: Template, template_data: dict[str, Any]) -> CardSizeReport:
+    """Split the bytes of a card into its parts.
+
+    Args:
+        template: Template the card is rendered with.
+        template_data: Template data of the card (see get_card_template_data).
+
+    Returns:
+        Size breakdown of the card. Parts that are not in the card are left out; theme
+        values baked into a minified template count as template.
+    """
+    total_size = _rendered_size(template, template_data)
+
+    def without(**blanked: Any) -> int:
+        return total_size - _rendered_size(template, {**template_data, **blanked})
+
+    parts = []
+    for key, (name, img_type) in IMAGE_PARTS.items():
+        size = without(**{key: ""})
+        if size:
+            decoded_size = len(base64.b64decode(template_data[key]))
+            parts.append(SizePart(name, size, decoded_size, img_type))
+    if template_data.get("background_tiles"):
+        parts.append(SizePart(
+            "background tiles",
+            without(background_tiles=_blank(template_data["background_tiles"])),
+            sum(len(base64.b64decode(tile)) for tile in template_data["background_tiles"]),
+            "background",
+        ))
+    if template_data.get("inline_font_css"):
+        # A blank (but not empty) style sheet, so the Google Fonts links are not added
+        parts.append(SizePart("embedded fonts", without(inline_font_css=" ")))
+    parts.append(SizePart("tile pool", without(**{key: _blank(template_data[key]) for key in TILE_POOL_KEYS})))
+    if theme_size := without(theme_assets=_blank(template_data["theme_assets"])):
+        parts.append(SizePart("theme", theme_size))
+    parts.insert(0, SizePart("template", total_size - sum(part.size for part in parts)))
+    return CardSizeReport(total_size, parts)
+
+
+def show_size_report(
+        report: CardSizeReport, title: str, console: Console, max_card_kb: float | None = None
+) -> None:
+    """Print the size breakdown of a card.
+
+    Args:
+        report: Size breakdown of the card.
+        title: Table title.
+        console: Rich console to print to.
+        max_card_kb: Optional size budget of a card in KB, shown with the total.
+    """
+    table = Table(title=title)
+    table.add_column("Part", style="cyan")
+    table.add_column("Size", style="magenta", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Before base64", style="dim", justify="right")
+    for part in sorted(report.parts, key=lambda part: part.size, reverse=True):
+        table.add_row(
+            part.name,
+            f"{part.size / 1024:.1f} KB",
+            f"{part.size / report.total_size:.0%}",
+            f"{part.decoded_size / 1024:.1f} KB" if part.decoded_size is not None else "",
+        )
+    budget = f" / {max_card_kb:.0f} KB budget" if max_card_kb is not None else ""
+    over = max_card_kb is not None and report.total_size > max_card_kb * 1024
+    table.add_section()
+    table.add_row(
+        "[bold]total[/]",
+        f"[bold {'red' if over else 'green'}]{report.total_size / 1024:.1f} KB[/]{budget}",
+        "",
+        "",
+    )
+    console.print(table)
+
+
+def fit_image_targets(report: CardSizeReport, max_card_kb: float) -> dict[ImageType, float]:
+    """Get tighter image size targets that should bring a card within its budget.
+
+    Every image type's target is lowered by the same factor, from the images' current
+    sizes, so the images share the room left by the rest of the card.
+
+    Args:
+        report: Size breakdown of the card over budget.
+        max_card_kb: Size budget of a card in KB.
+
+    Returns:
+        Target size in KB for each image type.
+
+    Raises:
+        ValueError: If the card is over budget even without its images.
+    """
+    image_room = max_card_kb * 1024 - (report.total_size - report.image_size)
+    if image_room <= 0:
+        raise ValueError(
+            f"Cards cannot fit in {max_card_kb:.0f} KB: the parts other than images already "
+            f"take {(report.total_size - report.image_size) / 1024:.1f} KB"
+        )
+    scale = image_room / report.image_size * FIT_MARGIN
+
+    targets = dict(IMAGE_TARGET_SIZES_KB)
+    for img_type in targets:
+        decoded_sizes = [
+            part.decoded_size for part in report.parts
+            if part.image_type == img_type and part.decoded_size is not None
+        ]
+        if decoded_sizes:
+            targets[img_type] = min(targets[img_type], max(decoded_sizes) / 1024 * scale)
+    return targets
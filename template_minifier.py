@@ -0,0 +1,309 @@
+"""Minified production builds of the bingo card template.
+
+The template source is minified once per (template, theme) pair and the compiled result is
+cached, so each card only renders its per-card data into already-minified static text:
+
+1. Theme-only expressions (``{{ theme_assets.css_variables }}``, ``{% if theme %}`` blocks,
+   ...) are evaluated and baked into the source, as the theme is fixed for the cached template.
+2. The static text is minified: comments and indentation are removed from the HTML, CSS
+   and JavaScript. The remaining Jinja tags are kept as opaque tokens.
+
+The minifiers are deliberately conservative (no renaming or restructuring): strings are
+never touched and JavaScript keeps its line breaks wherever automatic semicolon insertion
+could depend on them. JavaScript regex literals are not recognized; the template has none.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from jinja2 import Environment, Template, meta
+from loguru import logger
+
+from themes import Theme, compile_theme_assets
+
+logger.disable(__name__)  # Enabled by the CLIs
+
+_JINJA_TAG_RE = re.compile(r"(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})", re.DOTALL)
+_BLOCK_TAG_RE = re.compile(r"\{%-?\s*(\w+)(.*?)-?%\}", re.DOTALL)
+_EXPRESSION_TAG_RE = re.compile(r"\{\{-?(.*?)-?\}\}", re.DOTALL)
+
+# Remaining Jinja tags are swapped for these while the static text is minified
+_PLACEHOLDER = "\x00{}\x00"
+_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+
+_RAW_TEXT_RE = re.compile(r"(<(style|script)\b[^>]*>)(.*?)(</\2>)", re.DOTALL | re.IGNORECASE)
+
+# Characters that whitespace can be dropped next to. '+' and '-' are left out in JavaScript,
+# so 'a + +b' never turns into 'a ++b'
+_CSS_PUNCTUATION = set("{};,>")
+_JS_PUNCTUATION = set("{}()[];,=:<>?&|!*/")
+
+_environment = Environment()
+
+# Template variables that are fixed for a given theme
+_THEME_VARIABLES = {"theme", "theme_assets"}
+
+# (template path, theme fingerprint) -> (template mtime, compiled minified template)
+_minified_templates: dict[tuple[str, str], tuple[int, Template]] = {}
+
+
+def _is_theme_only(expression: str) -> bool:
+    """Check whether a Jinja expression depends on nothing but the theme."""
+    try:
+        variables = meta.find_undeclared_variables(_environment.parse(f"{{{{ {expression} }}}}"))
+    except Exception:
+        return False
+    return bool(variables) and variables <= _THEME_VARIABLES
+
+
+def _evaluate(expression: str, theme_config: Theme | None):
+    return _environment.compile_expression(expression)(
+        theme=theme_config,
+        theme_assets=compile_theme_assets(theme_config),
+    )
+
+
+def _as_literal(text: str) -> str:
+    """Wrap baked text in a raw block if Jinja would otherwise parse it."""
+    if any(delimiter in text for delimiter in ("{{", "{%", "{#")):
+        return f"{{% raw %}}{text}{{% endraw %}}"
+    return text
+
+
+def _split_if_block(tokens: list[str], start: int) -> tuple[list[tuple[str | None, list[str]]], int]:
+    """Split an if block into its branches.
+
+    Args:
+        tokens: Template source split into text and Jinja tags.
+        start: Index of the block's ``{% if %}`` tag.
+
+    Returns:
+        Tuple of the (condition, body tokens) branches, with None as the condition of an
+        else branch, and the index after the block's ``{% endif %}`` tag.
+    """
+    condition = _BLOCK_TAG_RE.fullmatch(tokens[start]).group(2).strip()
+    branches: list[tuple[str | None, list[str]]] = [(condition, [])]
+    depth = 0
+    for index in range(start + 1, len(tokens)):
+        token = tokens[index]
+        tag = _BLOCK_TAG_RE.fullmatch(token)
+        name = tag.group(1) if tag else None
+        if name == "if":
+            depth += 1
+        elif name == "endif" and depth > 0:
+            depth -= 1
+        elif depth == 0 and name == "endif":
+            return branches, index + 1
+        elif depth == 0 and name == "elif":
+            branches.append((tag.group(2).strip(), []))
+            continue
+        elif depth == 0 and name == "else":
+            branches.append((None, []))
+            continue
+        branches[-1][1].append(token)
+    raise ValueError("Unterminated {% if %} block in template")
+
+
+def _bake_tokens(tokens: list[str], theme_config: Theme | None) -> list[str]:
+    baked: list[str] = []
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+
+        block = _BLOCK_TAG_RE.fullmatch(token)
+        if block and block.group(1) == "if" and _is_theme_only(block.group(2)):
+            branches, end = _split_if_block(tokens, index)
+            if all(condition is None or _is_theme_only(condition) for condition, _ in branches):
+                for condition, body in branches:
+                    if condition is None or _evaluate(condition, theme_config):
+                        baked.extend(_bake_tokens(body, theme_config))
+                        break
+                index = end
+                continue
+
+        expression = _EXPRESSION_TAG_RE.fullmatch(token)
+        if expression and _is_theme_only(expression.group(1)):
+            token = _as_literal(str(_evaluate(expression.group(1), theme_config)))
+        elif token.startswith("{#"):
+            # Jinja comments never render
+            token = ""
+
+        baked.append(token)
+        index += 1
+    return baked
+
+
+def bake_theme(source: str, theme_config: Theme | None) -> str:
+    """Evaluate the theme-only expressions and if blocks of a template source.
+
+    Args:
+        source: Jinja template source.
+        theme_config: Theme the template is rendered with (None for no theme).
+
+    Returns:
+        Template source with the theme's values in place of those expressions.
+    """
+    return "".join(_bake_tokens(_JINJA_TAG_RE.split(source), theme_config))
+
+
+def _split_strings(code: str, quotes: str, line_comments: bool) -> list[str]:
+    """Split code into alternating code and string literal parts (strings at odd indices)."""
+    parts = []
+    start = 0
+    index = 0
+    while index < len(code):
+        char = code[index]
+        if char in quotes:
+            end = index + 1
+            while end < len(code) and code[end] != char:
+                end += 2 if code[end] == "\\" else 1
+            parts.append(code[start:index])
+            parts.append(code[index:end + 1])
+            start = index = end + 1
+        elif code.startswith("/*", index):
+            # Skip comments here, so quotes inside them don't start a string
+            end = code.find("*/", index + 2)
+            index = len(code) if end == -1 else end + 2
+        elif line_comments and code.startswith("//", index):
+            end = code.find("\n", index)
+            index = len(code) if end == -1 else end
+        else:
+            index += 1
+    parts.append(code[start:])
+    return parts
+
+
+def _strip_around(code: str, punctuation: set[str]) -> str:
+    """Remove spaces next to punctuation characters."""
+    out: list[str] = []
+    for index, char in enumerate(code):
+        if char == " ":
+            previous = out[-1] if out else None
+            following = code[index + 1] if index + 1 < len(code) else None
+            if previous in punctuation or following in punctuation:
+                continue
+        out.append(char)
+    return "".join(out)
+
+
+def minify_css(css: str) -> str:
+    """Minify a stylesheet: drop comments and collapse whitespace.
+
+    Args:
+        css: CSS source.
+
+    Returns:
+        Minified CSS.
+    """
+    parts = _split_strings(css, "\"'", line_comments=False)
+    for index in range(0, len(parts), 2):
+        code = re.sub(r"/\*.*?\*/", "", parts[index], flags=re.DOTALL)
+        code = re.sub(r"\s+", " ", code)
+        code = _strip_around(code, _CSS_PUNCTUATION)
+        # Only after a colon: 'a :hover' and 'a:hover' select different elements
+        parts[index] = code.replace(": ", ":").replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def minify_js(js: str) -> str:
+    """Minify a script: drop comments and indentation, keeping statement line breaks.
+
+    Args:
+        js: JavaScript source.
+
+    Returns:
+        Minified JavaScript.
+    """
+    parts = _split_strings(js, "\"'`", line_comments=True)
+    for index in range(0, len(parts), 2):
+        code = re.sub(r"/\*.*?\*/|//[^\n]*", "", parts[index], flags=re.DOTALL)
+        code = re.sub(r"[ \t]+", " ", code)
+        code = re.sub(r" ?\n[\s]*", "\n", code)
+        parts[index] = _strip_around(code, _JS_PUNCTUATION)
+    js = "".join(parts)
+
+    # A line break is only kept where it can end a statement
+    js = re.sub(r"(?<=[{(\[;,])\n|\n(?=[})\].,;])", "", js)
+    return js.strip()
+
+
+def minify_html(html: str) -> str:
+    """Minify an HTML document: drop comments and indentation, and minify inline CSS/JS.
+
+    Whitespace between elements is collapsed rather than removed, as it can render as a
+    gap between inline elements.
+
+    Args:
+        html: HTML source (Jinja tags must already be replaced by placeholders).
+
+    Returns:
+        Minified HTML.
+    """
+    out: list[str] = []
+    position = 0
+    for match in _RAW_TEXT_RE.finditer(html):
+        out.append(_minify_markup(html[position:match.start()]))
+        open_tag, tag_name, content, close_tag = match.groups()
+        minify = minify_css if tag_name.lower() == "style" else minify_js
+        out.append(f"{open_tag}{minify(content)}{close_tag}")
+        position = match.end()
+    out.append(_minify_markup(html[position:]))
+    return "".join(out).strip()
+
+
+def _minify_markup(markup: str) -> str:
+    markup = re.sub(r"<!--(?!\[).*?-->", "", markup, flags=re.DOTALL)
+    # Whitespace runs with a line break become a single line break, others a single space
+    return re.sub(r"\s+", lambda m: "\n" if "\n" in m.group() else " ", markup)
+
+
+def minify_template_source(source: str) -> str:
+    """Minify the static text of a Jinja template, leaving its tags untouched.
+
+    Args:
+        source: Jinja template source.
+
+    Returns:
+        Minified template source.
+    """
+    tags: list[str] = []
+
+    def to_placeholder(match: re.Match) -> str:
+        tags.append(match.group())
+        return _PLACEHOLDER.format(len(tags) - 1)
+
+    minified = minify_html(_JINJA_TAG_RE.sub(to_placeholder, source))
+    return _PLACEHOLDER_RE.sub(lambda m: tags[int(m.group(1))], minified)
+
+
+def load_minified_template(template_path: Path, theme_config: Theme | None = None) -> Template:
+    """Load the minified template for a theme, compiling it once per template version.
+
+    Args:
+        template_path: Path to the Jinja template file.
+        theme_config: Theme the cards are rendered with.
+
+    Returns:
+        Compiled minified template with the theme bound.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    if not template_path.exists():
+        logger.error(f"Template file not found: {template_path}")
+        raise FileNotFoundError(f"Template file not found: {template_path}")
+
+    key = (str(template_path), json.dumps(theme_config, sort_keys=True))
+    mtime_ns = template_path.stat().st_mtime_ns
+    cached = _minified_templates.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    source = template_path.read_text(encoding="utf-8")
+    # Block tags sit on their own lines, so trim_blocks drops the line break each leaves behind
+    template = Template(minify_template_source(bake_theme(source, theme_config)), trim_blocks=True)
+    template.globals["theme"] = theme_config
+    template.globals["theme_assets"] = compile_theme_assets(theme_config)
+    _minified_templates[key] = (mtime_ns, template)
+    return template
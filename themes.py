@@ -1,9 +1,20 @@
 """Theme configurations for the bingo app.
 
-Each theme defines colors, messages, and visual elements.
+Each theme defines colors, messages, and visual elements. Besides the built-in themes,
+themes can be loaded from TOML or JSON files (see load_themes_dir), which are validated
+with pydantic. The parts of a card that depend only on the theme (CSS variables, font
+links and text fragments) are compiled once per theme and cached (see
+compile_theme_assets).
 """
 
-from typing import Literal, TypedDict
+import json
+import tomllib
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Literal, NotRequired, TypedDict
+from urllib.parse import quote_plus
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ThemeColors(TypedDict):
@@ -41,6 +52,13 @@ class ThemeFonts(TypedDict):
     primary: str
     secondary: str
     accent: str
+    google_fonts_url: NotRequired[str]  # Overrides the generated Google Fonts stylesheet URL
+
+
+class ThemeEffects(TypedDict):
+    """Celebration effect configuration for a theme."""
+    reduced_motion: bool  # Static celebrations only: no confetti, fleets or orbits
+    max_particles: int  # Size of the confetti pool (caps on-screen confetti)
 
 
 class Theme(TypedDict):
@@ -50,12 +68,13 @@ class Theme(TypedDict):
     messages: ThemeMessages
     emojis: ThemeEmojis
     fonts: ThemeFonts
+    effects: ThemeEffects
 
 
 ThemeName = Literal["alien", "ghost", "thanksgiving", "christmas"]
 
 
-THEMES: dict[ThemeName, Theme] = {
+THEMES: dict[str, Theme] = {
     "alien": {
         "name": "Alien Invasion",
         "colors": {
@@ -86,6 +105,10 @@ THEMES: dict[ThemeName, Theme] = {
             "primary": "Orbitron",
             "secondary": "Exo 2",
             "accent": "Audiowide"
+        },
+        "effects": {
+            "reduced_motion": False,
+            "max_particles": 300
         }
     },
     "ghost": {
@@ -117,7 +140,13 @@ THEMES: dict[ThemeName, Theme] = {
         "fonts": {
             "primary": "Creepster",
             "secondary": "Nosifer",
-            "accent": "Eater"
+            "accent": "Eater",
+            # These fonts only come in one weight
+            "google_fonts_url": "https://fonts.googleapis.com/css2?family=Creepster&family=Nosifer&family=Eater&display=swap"
+        },
+        "effects": {
+            "reduced_motion": False,
+            "max_particles": 300
         }
     },
     "thanksgiving": {
@@ -150,6 +179,10 @@ THEMES: dict[ThemeName, Theme] = {
             "primary": "Amatic SC",
             "secondary": "Patrick Hand",
             "accent": "Satisfy"
+        },
+        "effects": {
+            "reduced_motion": False,
+            "max_particles": 300
         }
     },
     "christmas": {
@@ -182,11 +215,132 @@ THEMES: dict[ThemeName, Theme] = {
             "primary": "Mountains of Christmas",
             "secondary": "Fredoka One",
             "accent": "Lobster"
+        },
+        "effects": {
+            "reduced_motion": False,
+            "max_particles": 300
         }
     }
 }
 
 
+# Look of a card rendered without a theme
+DEFAULT_THEME: Theme = {
+    **THEMES["alien"],
+    "name": "Default",
+    "colors": {**THEMES["alien"]["colors"], "tile_bg": "#1b1b47"},
+}
+
+# Built-in themes plus the themes loaded from theme files
+_registry: dict[str, Theme] = dict(THEMES)
+
+# Theme files only contain CSS colors and font names; these patterns keep them from
+# breaking out of the style sheet or font URL they are inserted into
+_CSS_COLOR_PATTERN = r"^(#[0-9A-Fa-f]{3,8}|(rgb|rgba|hsl|hsla)\([0-9.,%\s]+\)|[A-Za-z]+)$"
+_FONT_NAME_PATTERN = r"^[A-Za-z0-9 ]+$"
+
+CssColor = Annotated[str, Field(pattern=_CSS_COLOR_PATTERN)]
+FontName = Annotated[str, Field(pattern=_FONT_NAME_PATTERN)]
+
+
+class _ThemeFileModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class ThemeColorsModel(_ThemeFileModel):
+    """Validated color configuration of a theme file."""
+    background: CssColor
+    text: CssColor
+    primary: CssColor
+    secondary: CssColor
+    accent: CssColor
+    tile_bg: CssColor
+    tile_border: CssColor
+    tile_revealed_text: CssColor
+    neon_glow: CssColor
+    grid: CssColor
+
+
+class ThemeMessagesModel(_ThemeFileModel):
+    """Validated message configuration of a theme file."""
+    bingo: str
+    double_bingo: str
+    h_bingo: str
+    super_bingo: str
+
+
+class ThemeEmojisModel(_ThemeFileModel):
+    """Validated emoji configuration of a theme file."""
+    confetti: list[str] = Field(min_length=1)
+    decorations: list[str] = Field(min_length=2)
+    button_randomize: str
+    button_reset: str
+
+
+class ThemeFontsModel(_ThemeFileModel):
+    """Validated font configuration of a theme file."""
+    primary: FontName
+    secondary: FontName
+    accent: FontName
+    google_fonts_url: str | None = Field(default=None, pattern=r"^https://fonts\.googleapis\.com/[^\"'<>\s]*$")
+
+
+class ThemeEffectsModel(_ThemeFileModel):
+    """Validated celebration effect configuration of a theme file."""
+    reduced_motion: bool = False
+    max_particles: int = Field(default=300, ge=0, le=2000)
+
+
+class ThemeModel(_ThemeFileModel):
+    """Validated theme file."""
+    name: str
+    colors: ThemeColorsModel
+    messages: ThemeMessagesModel
+    emojis: ThemeEmojisModel
+    fonts: ThemeFontsModel
+    effects: ThemeEffectsModel = ThemeEffectsModel()
+
+
+def load_theme_file(theme_path: Path) -> Theme:
+    """Load and validate a theme from a TOML or JSON file.
+
+    Args:
+        theme_path: Path to the theme file.
+
+    Returns:
+        Theme configuration dictionary.
+
+    Raises:
+        ValueError: If the file is not valid TOML/JSON or not a valid theme.
+    """
+    text = theme_path.read_text(encoding="utf-8")
+    try:
+        data = tomllib.loads(text) if theme_path.suffix.lower() == ".toml" else json.loads(text)
+        theme = ThemeModel.model_validate(data).model_dump(exclude_none=True)
+    except ValueError as e:
+        raise ValueError(f"Invalid theme file {theme_path}: {e}") from e
+    return theme  # type: ignore[return-value]
+
+
+def load_themes_dir(themes_dir: Path) -> list[str]:
+    """Register every theme file in a directory, named after the file (e.g. 'neon.toml').
+
+    Themes loaded from files take precedence over built-in themes with the same name.
+
+    Args:
+        themes_dir: Directory containing .toml and .json theme files.
+
+    Returns:
+        Names of the loaded themes.
+    """
+    names = []
+    for theme_path in sorted(themes_dir.iterdir()):
+        if theme_path.suffix.lower() in (".toml", ".json") and theme_path.is_file():
+            _registry[theme_path.stem] = load_theme_file(theme_path)
+            names.append(theme_path.stem)
+    return names
+
+
 def get_theme(theme_name: str) -> Theme:
     """Get theme configuration by name.
 
@@ -196,7 +350,7 @@ def get_theme(theme_name: str) -> Theme:
     Returns:
         Theme configuration dictionary.
     """
-    return THEMES.get(theme_name, THEMES["alien"])  # type: ignore
+    return _registry.get(theme_name, THEMES["alien"])
 
 
 def list_themes() -> list[str]:
@@ -205,4 +359,71 @@ def list_themes() -> list[str]:
     Returns:
         List of theme name strings.
     """
-    return list(THEMES.keys())
+    return list(_registry.keys())
+
+
+class ThemeAssets(TypedDict):
+    """Theme-dependent parts of a card, compiled once per theme."""
+    name: str
+    css_variables: str  # Declarations for the template's :root rule
+    font_links: str  # <link> tags loading the fonts from Google Fonts
+    messages: ThemeMessages
+    emojis: ThemeEmojis
+    effects: ThemeEffects
+
+
+def _google_fonts_url(fonts: ThemeFonts) -> str:
+    if "google_fonts_url" in fonts:
+        return fonts["google_fonts_url"]
+    families = [
+        f"{quote_plus(fonts['primary'])}:wght@400;700",
+        f"{quote_plus(fonts['secondary'])}:wght@300;600",
+        quote_plus(fonts["accent"]),
+    ]
+    return f"https://fonts.googleapis.com/css2?family={'&family='.join(families)}&display=swap"
+
+
+@lru_cache(maxsize=32)
+def _compile_theme_assets(theme_json: str) -> ThemeAssets:
+    theme: Theme = json.loads(theme_json)
+    colors = theme["colors"]
+    fonts = theme["fonts"]
+    variables = {
+        "text-color": colors["text"],
+        "primary-color": colors["primary"],
+        "secondary-color": colors["secondary"],
+        "accent-color": colors["accent"],
+        "tile-bg": colors["tile_bg"],
+        "tile-border": colors["tile_border"],
+        "tile-revealed-text": colors["tile_revealed_text"],
+        "neon-glow": colors["neon_glow"],
+        "grid-color": colors["grid"],
+        "font-primary": f"'{fonts['primary']}'",
+        "font-secondary": f"'{fonts['secondary']}'",
+        "font-accent": f"'{fonts['accent']}'",
+    }
+    return {
+        "name": theme["name"],
+        "css_variables": "\n".join(f"--{name}: {value};" for name, value in variables.items()),
+        "font_links": (
+            '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+            f'<link href="{_google_fonts_url(fonts)}" rel="stylesheet">'
+        ),
+        "messages": theme["messages"],
+        "emojis": theme["emojis"],
+        "effects": theme["effects"],
+    }
+
+
+def compile_theme_assets(theme_config: Theme | None = None) -> ThemeAssets:
+    """Get the compiled theme-dependent parts of a card (cached per theme).
+
+    Args:
+        theme_config: Optional theme configuration dictionary. If None, the default look
+            is used.
+
+    Returns:
+        Compiled theme assets. The returned dictionary is shared and must not be modified.
+    """
+    return _compile_theme_assets(json.dumps(theme_config or DEFAULT_THEME, sort_keys=True))
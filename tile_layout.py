@@ -0,0 +1,150 @@
+"""Precomputed tile text layout for bingo cards.
+
+Tile strings are measured against the grid cell with Pillow's font metrics, so each tile
+gets its line breaks and a font scale class up front instead of the browser reflowing
+long entries. Measurements are cached per (string, font, size) so batches stay cheap.
+
+All measurements use a reference cell: the font-to-cell ratio in bingo.jinja is the same
+for every grid size (the tile font is 5/N of the base size, the cell 1/N of the board) and
+every screen size (the base size is 2% of the board width), so one layout works for 5x5
+and 7x7 grids on any screen.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageFont
+
+from font_inliner import find_font_files
+from themes import Theme
+
+# Desktop layout of bingo.jinja at 4x, for more precise integer font sizes: 800px board
+# and 16px base font, so a 5x5 cell is 160px with 16px text
+REFERENCE_CELL_PX = 640
+REFERENCE_FONT_PX = 64
+TILE_PADDING_EM = 0.25  # .tile-front / .tile-back padding
+TEXT_PADDING_PX = 8  # .tile-text padding (2px at 1x)
+LINE_HEIGHT = 1.1  # .tile-text line-height
+
+# Font scale of each .tile-text fit-N class, largest first
+TILE_FONT_SCALES = (1.0, 0.85, 0.7, 0.6, 0.5, 0.4)
+
+# (text with line breaks, font scale class) for one tile
+TileLayout = tuple[str, str]
+
+
+@lru_cache(maxsize=64)
+def load_font(font_path: str | None, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load a font at a pixel size (cached).
+
+    Args:
+        font_path: Path to the font file, or None for Pillow's default font.
+        size: Font size in pixels.
+
+    Returns:
+        Pillow font object.
+    """
+    if font_path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=65536)
+def measure_text_width(text: str, font_path: str | None, size: int) -> float:
+    """Measure the rendered width of a string.
+
+    Args:
+        text: String to measure.
+        font_path: Path to the font file, or None for Pillow's default font.
+        size: Font size in pixels.
+
+    Returns:
+        Width of the text in pixels.
+    """
+    return load_font(font_path, size).getlength(text)
+
+
+def _wrap_words(words: list[str], max_width: float, font_path: str | None, size: int) -> list[str] | None:
+    """Greedily wrap words into lines, or return None if a single word is too wide."""
+    lines: list[str] = []
+    for word in words:
+        if measure_text_width(word, font_path, size) > max_width:
+            return None
+        candidate = f"{lines[-1]} {word}" if lines else word
+        if lines and measure_text_width(candidate, font_path, size) <= max_width:
+            lines[-1] = candidate
+        else:
+            lines.append(word)
+    return lines
+
+
+def _hard_wrap(text: str, max_width: float, font_path: str | None, size: int) -> list[str]:
+    """Wrap text by characters, breaking inside words where needed."""
+    lines = [""]
+    for char in text:
+        candidate = lines[-1] + char
+        if lines[-1] and measure_text_width(candidate, font_path, size) > max_width:
+            lines.append(char.lstrip())
+        else:
+            lines[-1] = candidate
+    return [line.strip() for line in lines]
+
+
+@lru_cache(maxsize=65536)
+def layout_tile_text(text: str, font_path: str | None = None) -> TileLayout:
+    """Choose the line breaks and largest font scale at which a tile string fits its cell.
+
+    Args:
+        text: Tile string.
+        font_path: Path to the tile font file, or None for Pillow's default font.
+
+    Returns:
+        Tuple of the text with newline-separated lines and its font scale class.
+    """
+    words = text.split()
+    for scale_index, scale in enumerate(TILE_FONT_SCALES):
+        size = round(REFERENCE_FONT_PX * scale)
+        available = REFERENCE_CELL_PX - 2 * (TILE_PADDING_EM * size + TEXT_PADDING_PX)
+        lines = _wrap_words(words, available, font_path, size)
+        if lines is not None and len(lines) * LINE_HEIGHT * size <= available:
+            return "\n".join(lines), f"fit-{scale_index}"
+
+    # Nothing fits: use the smallest scale and break inside words
+    scale_index = len(TILE_FONT_SCALES) - 1
+    size = round(REFERENCE_FONT_PX * TILE_FONT_SCALES[scale_index])
+    available = REFERENCE_CELL_PX - 2 * (TILE_PADDING_EM * size + TEXT_PADDING_PX)
+    return "\n".join(_hard_wrap(" ".join(words), available, font_path, size)), f"fit-{scale_index}"
+
+
+def layout_tiles(items: list[str], font_path: Path | None = None) -> list[TileLayout]:
+    """Lay out a list of tile strings.
+
+    Args:
+        items: Tile strings.
+        font_path: Path to the tile font file, or None for Pillow's default font.
+
+    Returns:
+        List of (text with line breaks, font scale class) tuples in the same order.
+    """
+    font_key = str(font_path) if font_path is not None else None
+    return [layout_tile_text(item, font_key) for item in items]
+
+
+def find_tile_font(fonts_dir: Path | None, theme_config: Theme | None = None) -> Path | None:
+    """Find the font file tile text is rendered with (the theme's secondary font).
+
+    Args:
+        fonts_dir: Optional directory containing the theme's font files.
+        theme_config: Optional theme configuration dictionary.
+
+    Returns:
+        Path to the regular weight font file if available, else None.
+    """
+    if fonts_dir is None:
+        return None
+    family = theme_config["fonts"]["secondary"] if theme_config else "Exo 2"
+    font_files = find_font_files(fonts_dir, family)
+    if not font_files:
+        return None
+    regular = [path for path in font_files if "regular" in path.stem.lower()]
+    return (regular or font_files)[0]